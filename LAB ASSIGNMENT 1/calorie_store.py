@@ -0,0 +1,231 @@
+'''
+Structured calorie log for tracker.py
+
+Each saved session is one JSON line in calorie_log.jsonl. A sidecar file,
+calorie_log.jsonl.idx, holds one "YYYY-MM-DD offset" line for the first
+session of every day, so range summaries seek straight to the start date
+instead of re-reading years of log.
+
+Usage:
+    python calorie_store.py migrate calorie_log.txt
+    python calorie_store.py summary --from 2025-11-01 --to 2025-11-30
+'''
+import argparse
+import bisect
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+
+LOG_PATH = "calorie_log.jsonl"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def index_path(path):
+    return path + ".idx"
+
+
+def load_index(path=LOG_PATH):
+    """Return parallel lists of dates and byte offsets from the sidecar index."""
+    dates, offsets = [], []
+    try:
+        with open(index_path(path)) as f:
+            for line in f:
+                day, offset = line.split()
+                dates.append(day)
+                offsets.append(int(offset))
+    except FileNotFoundError:
+        pass
+    return dates, offsets
+
+
+def make_record(meal_name, calorie_amount, limit=None, timestamp=None):
+    timestamp = timestamp or datetime.now().strftime(TIME_FORMAT)
+    total = sum(calorie_amount)
+    return {
+        "timestamp": timestamp,
+        "date": timestamp[:10],
+        "meals": [{"name": n, "calories": c} for n, c in zip(meal_name, calorie_amount)],
+        "total": total,
+        "average": round(total / len(calorie_amount), 2) if calorie_amount else 0.0,
+        "limit": limit,
+    }
+
+
+def read_all(path=LOG_PATH):
+    try:
+        with open(path, "rb") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def rewrite_store(records, path=LOG_PATH):
+    """Rewrite the log and its index with records sorted by timestamp."""
+    records = sorted(records, key=lambda r: r["timestamp"])
+    index_lines = []
+    with open(path + ".tmp", "wb") as f:
+        for record in records:
+            if not index_lines or record["date"] > index_lines[-1][0]:
+                index_lines.append((record["date"], f.tell()))
+            f.write((json.dumps(record) + "\n").encode("utf-8"))
+    with open(index_path(path) + ".tmp", "w") as f:
+        f.writelines(f"{day} {offset}\n" for day, offset in index_lines)
+    os.replace(path + ".tmp", path)
+    os.replace(index_path(path) + ".tmp", index_path(path))
+
+
+def append_session(meal_name, calorie_amount, limit=None, timestamp=None, path=LOG_PATH):
+    """Append one tracker session.
+
+    A session dated before the last indexed day would be invisible to the
+    index, so in that case the whole store is rewritten in timestamp order.
+    """
+    record = make_record(meal_name, calorie_amount, limit, timestamp)
+    dates, _ = load_index(path)
+    if dates and record["date"] < dates[-1]:
+        rewrite_store(read_all(path) + [record], path)
+        return record
+
+    with open(path, "ab") as f:
+        offset = f.tell()
+        f.write((json.dumps(record) + "\n").encode("utf-8"))
+    if not dates or record["date"] > dates[-1]:
+        with open(index_path(path), "a") as f:
+            f.write(f"{record['date']} {offset}\n")
+    return record
+
+
+def read_range(start, end, path=LOG_PATH):
+    """Yield sessions dated start..end (inclusive, 'YYYY-MM-DD' strings)."""
+    dates, offsets = load_index(path)
+    i = bisect.bisect_left(dates, start)
+    if i == len(dates):
+        return
+    with open(path, "rb") as f:
+        f.seek(offsets[i])
+        for line in f:
+            record = json.loads(line)
+            if record["date"] > end:
+                break
+            yield record
+
+
+def daily_totals(start, end, path=LOG_PATH):
+    totals = {}
+    for record in read_range(start, end, path):
+        totals[record["date"]] = totals.get(record["date"], 0.0) + record["total"]
+    return totals
+
+
+def rolling_average(start, end, window=7, path=LOG_PATH):
+    """Average daily intake over the logged days in each trailing window."""
+    first = (date.fromisoformat(start) - timedelta(days=window - 1)).isoformat()
+    totals = daily_totals(first, end, path)
+    result = {}
+    day = date.fromisoformat(start)
+    while day <= date.fromisoformat(end):
+        span = [(day - timedelta(days=d)).isoformat() for d in range(window)]
+        logged = [totals[d] for d in span if d in totals]
+        if logged:
+            result[day.isoformat()] = sum(logged) / len(logged)
+        day += timedelta(days=1)
+    return result
+
+
+def days_over_limit(start, end, limit=None, path=LOG_PATH):
+    """Days whose total exceeds limit, or the limit saved with that day's sessions."""
+    totals, limits = {}, {}
+    for record in read_range(start, end, path):
+        day = record["date"]
+        totals[day] = totals.get(day, 0.0) + record["total"]
+        if record.get("limit") is not None:
+            limits[day] = record["limit"]
+    over = {}
+    for day, total in totals.items():
+        day_limit = limit if limit is not None else limits.get(day)
+        if day_limit is not None and total > day_limit:
+            over[day] = total - day_limit
+    return over
+
+
+def parse_text_log(text):
+    """Parse the old free-text calorie_log.txt into (timestamp, meals, calories)."""
+    sessions = []
+    for block in text.split("Daily Calorie Tracker Log")[1:]:
+        stamp = re.search(r"Timestamp:\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", block)
+        if not stamp:
+            continue
+        meals, calories = [], []
+        sections = block.split("-" * 34)
+        if len(sections) >= 3:
+            for line in sections[1].strip().splitlines():
+                name, _, amount = line.rpartition("\t")
+                try:
+                    calories.append(float(amount))
+                except ValueError:
+                    continue
+                meals.append(name.strip())
+        sessions.append((stamp.group(1), meals, calories))
+    return sorted(sessions)
+
+
+def migrate_text_log(text_path, path=LOG_PATH):
+    """Merge the old text log into the store; returns the number of new sessions.
+
+    Sessions already in the store (same timestamp and meals) are skipped, so
+    running the migration again adds nothing. The store and index are
+    rewritten in timestamp order, so sessions logged before migrating stay
+    reachable by date.
+    """
+    with open(text_path) as f:
+        sessions = parse_text_log(f.read())
+    records = read_all(path)
+    seen = {(r["timestamp"], json.dumps(r["meals"])) for r in records}
+    added = 0
+    for timestamp, meals, calories in sessions:
+        record = make_record(meals, calories, timestamp=timestamp)
+        key = (record["timestamp"], json.dumps(record["meals"]))
+        if key not in seen:
+            seen.add(key)
+            records.append(record)
+            added += 1
+    if added:
+        rewrite_store(records, path)
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calorie log tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mig = sub.add_parser("migrate", help="import the old text log")
+    mig.add_argument("text_log", nargs="?", default="calorie_log.txt")
+    summ = sub.add_parser("summary", help="daily totals, rolling average, days over limit")
+    summ.add_argument("--from", dest="start", required=True, help="YYYY-MM-DD")
+    summ.add_argument("--to", dest="end", required=True, help="YYYY-MM-DD")
+    summ.add_argument("--window", type=int, default=7)
+    summ.add_argument("--limit", type=float, default=None)
+    parser.add_argument("--log", default=LOG_PATH)
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        count = migrate_text_log(args.text_log, args.log)
+        print(f"Migrated {count} sessions to {args.log}")
+        return
+
+    totals = daily_totals(args.start, args.end, args.log)
+    rolling = rolling_average(args.start, args.end, args.window, args.log)
+    over = days_over_limit(args.start, args.end, args.limit, args.log)
+    print("Date\t\tTotal\t\tRolling avg")
+    print("----------------------------------------------")
+    for day, total in totals.items():
+        print(f"{day}\t{total:.1f}\t\t{rolling.get(day, 0.0):.2f}")
+    print("----------------------------------------------")
+    print(f"Days logged: {len(totals)}")
+    print(f"Days over limit: {len(over)}")
+    for day, excess in over.items():
+        print(f"  {day}: over by {excess:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+
+import calorie_store as cs
+
+
+def test_range_queries_seek_by_date(tmp_path):
+    log = str(tmp_path / "log.jsonl")
+    day = date(2024, 1, 1)
+    for d in range(60):
+        stamp = (day + timedelta(days=d)).isoformat()
+        cs.append_session(["lunch", "dinner"], [500.0, 1000.0 + d], limit=1520,
+                          timestamp=f"{stamp} 12:00:00", path=log)
+    cs.append_session(["snack"], [100.0], timestamp="2024-02-29 20:00:00", path=log)
+
+    dates, offsets = cs.load_index(log)
+    assert len(dates) == 60 and offsets == sorted(offsets)
+
+    totals = cs.daily_totals("2024-02-28", "2024-02-29", log)
+    assert totals == {"2024-02-28": 1558.0, "2024-02-29": 1659.0}
+    assert cs.rolling_average("2024-01-03", "2024-01-03", window=3, path=log) == {"2024-01-03": 1501.0}
+    over = cs.days_over_limit("2024-01-01", "2024-12-31", path=log)
+    assert sorted(over) == [(day + timedelta(days=d)).isoformat() for d in range(21, 60)]
+
+
+def test_migrate_text_log(tmp_path):
+    text = tmp_path / "calorie_log.txt"
+    text.write_text(
+        "Daily Calorie Tracker Log\nTimestamp: 2025-11-11 10:45:47\n\n"
+        "Meal Name\tCalories\n----------------------------------\n"
+        "breakfast\t\t330.0\nlunch\t\t800.0\n----------------------------------\n"
+        "Total:\t\t1130.0\nAverage:\t565.00\n")
+    log = str(tmp_path / "log.jsonl")
+    assert cs.migrate_text_log(str(text), log) == 1
+    [record] = cs.read_range("2025-11-11", "2025-11-11", log)
+    assert record["meals"] == [{"name": "breakfast", "calories": 330.0},
+                               {"name": "lunch", "calories": 800.0}]
+    assert record["total"] == 1130.0
+
+
+def test_migrate_after_new_sessions_keeps_index_ordered(tmp_path):
+    text = tmp_path / "calorie_log.txt"
+    text.write_text(
+        "Daily Calorie Tracker Log\nTimestamp: 2025-11-11 10:45:47\n\n"
+        "Meal Name\tCalories\n----------------------------------\n"
+        "lunch\t\t800.0\n----------------------------------\n"
+        "Total:\t\t800.0\nAverage:\t800.00\n")
+    log = str(tmp_path / "log.jsonl")
+    cs.append_session(["dinner"], [900.0], timestamp="2026-01-05 19:00:00", path=log)
+
+    assert cs.migrate_text_log(str(text), log) == 1
+    assert cs.migrate_text_log(str(text), log) == 0
+    assert cs.daily_totals("2025-11-01", "2025-11-30", log) == {"2025-11-11": 800.0}
+    assert list(cs.daily_totals("2025-01-01", "2026-12-31", log)) == ["2025-11-11", "2026-01-05"]
+
+    cs.append_session(["snack"], [100.0], timestamp="2025-12-01 09:00:00", path=log)
+    assert cs.daily_totals("2025-12-01", "2025-12-01", log) == {"2025-12-01": 100.0}
+    assert cs.load_index(log)[0] == ["2025-11-11", "2025-12-01", "2026-01-05"]
@@ -51,20 +51,9 @@ print(f"Average:\t{avg_calorie:.2f}")
 
 save = input("\nDo you want to save this report? (yes/no): ").lower()
 if save == "yes":
-    from datetime import datetime
-    time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open("calorie_log.txt", "a") as f:
-        f.write("Daily Calorie Tracker Log\n")
-        f.write(f"Timestamp: {time}\n\n")
-        f.write("Meal Name\tCalories\n")
-        f.write("----------------------------------\n")
-        for i in range(len(meal_name)):
-            f.write(f"{meal_name[i]}\t\t{calorie_amount[i]}\n")
-        f.write("----------------------------------\n")
-        f.write(f"Total:\t\t{Total_calorie}\n")
-        f.write(f"Average:\t{avg_calorie:.2f}\n")
-        
-    print("\n✅ Log saved to calorie_log.txt")
+    from calorie_store import LOG_PATH, append_session
+    append_session(meal_name, calorie_amount, user_calorie_limit)
+    print(f"\n✅ Log saved to {LOG_PATH}")
 
 print("\nThank you for using the Calorie Tracker!")
 
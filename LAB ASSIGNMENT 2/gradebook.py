@@ -12,12 +12,37 @@ Features:
 - Pass/Fail lists using list comprehensions
 - Formatted result table and menu loop
 - Optional CSV export of final grade table
+- Vectorized NumPy statistics engine for very large mark sheets
+- Streaming mode with approximate percentiles for files too large to load
+- Non-interactive batch mode grading many sections in parallel (--batch)
+- Rank, percentile, top-N and score-range queries
 """
 
+from __future__ import annotations
+
+import argparse
+import bisect
 import csv
+import glob
+import math
+import os
+import random
 import sys
+from fractions import Fraction
+from itertools import repeat
+from pathlib import Path
 from statistics import mean, median
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Sequence
+
+# NumPy is imported inside the functions that need it, so the menu and
+# --help start without paying for it.
+
+def parse_score(text: str) -> float:
+    """float() that also rejects nan and inf, which float() happily parses."""
+    score = float(text)
+    if not math.isfinite(score):
+        raise ValueError(f"non-finite score: {text!r}")
+    return score
 
 def read_csv(path: str) -> Dict[str, float]:
     data = {}
@@ -30,7 +55,7 @@ def read_csv(path: str) -> Dict[str, float]:
                     continue
                 name = row[0].strip()
                 try:
-                    score = float(row[1])
+                    score = parse_score(row[1])
                 except (IndexError, ValueError):
                     continue
                 data[name] = score
@@ -40,9 +65,16 @@ def read_csv(path: str) -> Dict[str, float]:
         print("Error reading CSV:", e)
     return data
 
-def manual_entry() -> Dict[str, float]:
+def manual_entry(data: Dict[str, float] = None, index: 'RankIndex' = None) -> Dict[str, float]:
+    """Read names and scores until 'done'.
+
+    Pass an existing marks dict to add to or correct it in place; re-entering a
+    name replaces that student's score. A RankIndex given as index is updated
+    with every accepted entry.
+    """
     print("Enter student records. Type 'done' as name when finished.")
-    data = {}
+    if data is None:
+        data = {}
     while True:
         name = input("Student name: ").strip()
         if not name:
@@ -52,7 +84,7 @@ def manual_entry() -> Dict[str, float]:
             break
         score_raw = input("Score (0-100): ").strip()
         try:
-            score = float(score_raw)
+            score = parse_score(score_raw)
             if score < 0 or score > 100:
                 print("Score must be between 0 and 100.")
                 continue
@@ -60,6 +92,8 @@ def manual_entry() -> Dict[str, float]:
             print("Invalid score. Enter a numeric value.")
             continue
         data[name] = score
+        if index is not None:
+            index.set(name, score)
     return data
 
 # Task 3: Statistical functions
@@ -104,6 +138,129 @@ def grade_distribution(grades: Dict[str, str]) -> Dict[str, int]:
             dist[g] += 1
     return dist
 
+# Grade bands as (letter, minimum score), highest first; anything below the
+# last cutoff gets FAIL_GRADE. Matches assign_grade().
+GRADE_CUTOFFS: Sequence[Tuple[str, float]] = (('A', 90.0), ('B', 80.0), ('C', 70.0), ('D', 60.0))
+FAIL_GRADE = 'F'
+
+def grade_bands(scores: np.ndarray, cutoffs=GRADE_CUTOFFS) -> Tuple[np.ndarray, List[str]]:
+    """Return the band index of every score and the band letters.
+
+    Index 0 is the top band; the last index is FAIL_GRADE.
+    """
+    import numpy as np
+    letters = [g for g, _ in cutoffs] + [FAIL_GRADE]
+    thresholds = np.array([c for _, c in reversed(cutoffs)], dtype=float)
+    # Number of cutoffs each score reaches, 0 (fail) .. len(cutoffs) (top band)
+    reached = np.searchsorted(thresholds, scores, side='right')
+    return len(cutoffs) - reached, letters
+
+# Mantissa halves are below 2**27 in magnitude, so float64 bin sums over
+# fewer rows than this stay exact (< 2**53).
+EXACT_SUM_CHUNK = (1 << 26) - 1
+
+def exact_sum(scores: np.ndarray) -> Fraction:
+    """Exact sum of a finite float array, using array sums per exponent.
+
+    Each float is split by frexp into a 53-bit mantissa and a power of two.
+    The mantissa's high and low halves are exact floats whose per-exponent
+    sums come from np.bincount (no sort), and the bins are combined as
+    Python ints. This is what lets the vectorized average round exactly like
+    statistics.mean.
+    """
+    import numpy as np
+    if not np.isfinite(scores).all():
+        raise ValueError("exact_sum needs finite scores")
+    if len(scores) == 0:
+        return Fraction(0)
+    mant, exp = np.frexp(scores)
+    lo_exp = int(exp.min())
+    total = 0
+    for start in range(0, len(mant), EXACT_SUM_CHUNK):
+        bins = exp[start:start + EXACT_SUM_CHUNK] - lo_exp
+        # mant * 2**53 == hi * 2**26 + lo with integral hi, lo; all exact.
+        low = mant[start:start + EXACT_SUM_CHUNK] * 2.0**27
+        high = np.floor(low)
+        low -= high
+        low *= 2.0**26
+        hi = np.bincount(bins, weights=high)
+        lo = np.bincount(bins, weights=low)
+        for shift in np.flatnonzero((hi != 0) | (lo != 0)):
+            total += ((int(hi[shift]) << 26) + int(lo[shift])) << int(shift)
+    return Fraction(total) * Fraction(2) ** (lo_exp - 53)
+
+def gradebook_array(marks: 'MarksArray', cutoffs=GRADE_CUTOFFS) -> Dict[str, str]:
+    """build_gradebook() for a MarksArray, graded in bulk with grade_bands()."""
+    bands, letters = grade_bands(marks.scores, cutoffs)
+    return dict(zip(marks.names, (letters[b] for b in bands.tolist())))
+
+class MarksArray:
+    """Student marks as a float64 array with a parallel list of names."""
+
+    def __init__(self, names: List[str], scores: np.ndarray):
+        self.names = names
+        self.scores = scores
+
+    @classmethod
+    def from_dict(cls, marks: Dict[str, float]) -> 'MarksArray':
+        import numpy as np
+        scores = np.fromiter(marks.values(), dtype=float, count=len(marks))
+        return cls(list(marks), scores)
+
+    def __len__(self):
+        return len(self.names)
+
+def analyze_marks(marks: MarksArray, pass_mark: float = 40.0, cutoffs=GRADE_CUTOFFS) -> dict:
+    """Compute every statistic the menu reports from one array.
+
+    Results match calculate_average, calculate_median, find_max_score,
+    find_min_score, build_gradebook, grade_distribution and pass_fail_lists.
+    The median uses np.partition (selection) instead of a full sort, and the
+    average is rounded from an exact total, as statistics.mean does. Scores
+    must be finite (read_csv and manual_entry skip nan/inf); otherwise a
+    ValueError is raised.
+    """
+    import numpy as np
+    if not np.isfinite(marks.scores).all():
+        raise ValueError("analyze_marks needs finite scores")
+    n = len(marks)
+    letters = [g for g, _ in cutoffs] + [FAIL_GRADE]
+    if n == 0:
+        return {
+            'average': 0.0, 'median': 0.0, 'max': ("", 0.0), 'min': ("", 0.0),
+            'grades': {}, 'distribution': {g: 0 for g in letters},
+            'passed': [], 'failed': [],
+        }
+
+    scores = marks.scores
+    names = np.array(marks.names, dtype=object)
+
+    mid = n // 2
+    if n % 2:
+        med = float(np.partition(scores, mid)[mid])
+    else:
+        part = np.partition(scores, [mid - 1, mid])
+        med = (float(part[mid - 1]) + float(part[mid])) / 2
+
+    i_max = int(np.argmax(scores))
+    i_min = int(np.argmin(scores))
+
+    bands, letters = grade_bands(scores, cutoffs)
+    band_letters = np.array(letters, dtype=object)[bands]
+    counts = np.bincount(bands, minlength=len(letters))
+
+    passed_mask = scores >= pass_mark
+    return {
+        'average': float(exact_sum(scores) / n),
+        'median': med,
+        'max': (marks.names[i_max], float(scores[i_max])),
+        'min': (marks.names[i_min], float(scores[i_min])),
+        'grades': dict(zip(marks.names, band_letters.tolist())),
+        'distribution': {g: int(c) for g, c in zip(letters, counts)},
+        'passed': names[passed_mask].tolist(),
+        'failed': names[~passed_mask].tolist(),
+    }
+
 # Task 5: Pass/Fail filter
 def pass_fail_lists(marks: Dict[str, float], pass_mark: float = 40.0) -> Tuple[List[str], List[str]]:
     passed = [name for name, s in marks.items() if s >= pass_mark]
@@ -139,14 +296,381 @@ def sample_demo():
         'Eve': 88
     }
 
+# Rank and top-k queries
+class RankIndex:
+    """Order-statistics index over student marks.
+
+    Entries are kept sorted as (-score, seq, name) so the best score comes
+    first and ties keep entry order. Rank, percentile, top-k and score-range
+    lookups are binary searches; set() re-positions a single student, which
+    keeps the index in step with edits made through manual_entry().
+    """
+
+    def __init__(self, marks: Dict[str, float]):
+        self._keys: Dict[str, Tuple[float, int]] = {}
+        self._seq = 0
+        for name, score in marks.items():
+            self._keys[name] = (-score, self._seq)
+            self._seq += 1
+        self._entries = sorted((key[0], key[1], name) for name, key in self._keys.items())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def set(self, name: str, score: float):
+        """Add a student or change their score."""
+        if name in self._keys:
+            neg, seq = self._keys[name]
+            del self._entries[bisect.bisect_left(self._entries, (neg, seq))]
+        else:
+            seq = self._seq
+            self._seq += 1
+        self._keys[name] = (-score, seq)
+        bisect.insort(self._entries, (-score, seq, name))
+
+    def rank(self, name: str) -> int:
+        """1-based rank; students with equal scores share a rank."""
+        neg, _ = self._keys[name]
+        return bisect.bisect_left(self._entries, (neg,)) + 1
+
+    def percentile(self, name: str) -> float:
+        """Percentage of students scoring at or below this student."""
+        neg, _ = self._keys[name]
+        at_or_below = len(self._entries) - bisect.bisect_left(self._entries, (neg,))
+        return 100.0 * at_or_below / len(self._entries)
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        if k < 1:
+            raise ValueError("top needs k >= 1")
+        return [(name, -neg) for neg, _, name in self._entries[:k]]
+
+    def between(self, low: float, high: float) -> List[Tuple[str, float]]:
+        """Students with low <= score <= high, best first."""
+        start = bisect.bisect_left(self._entries, (-high,))
+        end = bisect.bisect_left(self._entries, (-low, math.inf))
+        return [(name, -neg) for neg, _, name in self._entries[start:end]]
+
+def rank_queries(marks: Dict[str, float]):
+    """Advisor sub-menu for rank, percentile, top-k and range lookups."""
+    index = RankIndex(marks)
+    while True:
+        print("\nRank queries:\n1) Rank/percentile of a student\n2) Top N students\n"
+              "3) Students in a score range\n4) Add or edit marks\n5) Back")
+        choice = input("Choose an option (1-5): ").strip()
+        if choice == '5':
+            return
+        try:
+            if choice == '1':
+                name = input("Student name: ").strip()
+                if name not in marks:
+                    print("Student not found.")
+                    continue
+                print(f"{name}: rank {index.rank(name)} of {len(index)}, "
+                      f"percentile {index.percentile(name):.1f}")
+            elif choice == '2':
+                for pos, (name, score) in enumerate(index.top(int(input("N: "))), 1):
+                    print(f"{pos:3}. {name:15}\t{score:6.1f}")
+            elif choice == '3':
+                low = float(input("Lowest score: "))
+                high = float(input("Highest score: "))
+                found = index.between(low, high)
+                for name, score in found:
+                    print(f"{name:15}\t{score:6.1f}")
+                print(f"{len(found)} student(s) in range.")
+            elif choice == '4':
+                manual_entry(marks, index)
+            else:
+                print("Invalid option.")
+        except ValueError:
+            print("Invalid number.")
+
+# Streaming analysis for mark sheets too large to load with read_csv
+class KLLSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Keeps O(k) values no matter how many are added. With the default k=200
+    the rank error is about 1.65% with 99% confidence (the figure Apache
+    DataSketches publishes for KLL at the same k): an estimated median lies
+    between the true 48.35th and 51.65th percentiles.
+    """
+
+    def __init__(self, k: int = 200, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels: List[List[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        while (sum(len(items) for items in self.levels)
+               >= sum(self._capacity(h) for h in range(len(self.levels)))):
+            for h, items in enumerate(self.levels):
+                if len(items) < self._capacity(h):
+                    continue
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                leftover = [items.pop()] if len(items) % 2 else []
+                # Keep every other item (random phase); each survivor now
+                # stands for twice the weight one level up.
+                self.levels[h + 1].extend(items[self._rng.getrandbits(1)::2])
+                self.levels[h] = leftover
+                break
+
+    def update(self, values: Sequence[float]):
+        self.levels[0].extend(values)
+        self.n += len(values)
+        self._compress()
+
+    def merge(self, other: 'KLLSketch'):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.n += other.n
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """Estimated value at rank fraction q (0..1)."""
+        import numpy as np
+        if self.n == 0:
+            return 0.0
+        values = np.concatenate([np.asarray(items, dtype=float) for items in self.levels])
+        weights = np.concatenate([np.full(len(items), 2 ** h, dtype=float)
+                                  for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        i = int(np.searchsorted(cumulative, q * cumulative[-1], side='left'))
+        return float(values[order][min(i, len(order) - 1)])
+
+class StreamingStats:
+    """Running count, exact sum, min/max, grade bands and a KLL sketch.
+
+    Memory does not grow with the number of rows, and two instances can be
+    merged, so partial results from separate files combine exactly (apart
+    from the sketch-based percentiles).
+    """
+
+    def __init__(self, pass_mark: float = 40.0, cutoffs=GRADE_CUTOFFS, k: int = 200, seed=None):
+        import numpy as np
+        self.pass_mark = pass_mark
+        self.cutoffs = cutoffs
+        self.letters = [g for g, _ in cutoffs] + [FAIL_GRADE]
+        self.count = 0
+        self.total = Fraction(0)
+        self.max: Tuple[str, float] = ("", 0.0)
+        self.min: Tuple[str, float] = ("", 0.0)
+        self.bands = np.zeros(len(self.letters), dtype=np.int64)
+        self.passed = 0
+        self.sketch = KLLSketch(k, seed)
+
+    def update(self, names: List[str], scores: np.ndarray):
+        import numpy as np
+        if len(scores) == 0:
+            return
+        i_max = int(np.argmax(scores))
+        i_min = int(np.argmin(scores))
+        if self.count == 0 or scores[i_max] > self.max[1]:
+            self.max = (names[i_max], float(scores[i_max]))
+        if self.count == 0 or scores[i_min] < self.min[1]:
+            self.min = (names[i_min], float(scores[i_min]))
+        self.count += len(scores)
+        self.total += exact_sum(scores)
+        bands, _ = grade_bands(scores, self.cutoffs)
+        self.bands += np.bincount(bands, minlength=len(self.letters))
+        self.passed += int(np.count_nonzero(scores >= self.pass_mark))
+        self.sketch.update(scores.tolist())
+
+    def merge(self, other: 'StreamingStats'):
+        if other.count == 0:
+            return
+        if self.count == 0 or other.max[1] > self.max[1]:
+            self.max = other.max
+        if self.count == 0 or other.min[1] < self.min[1]:
+            self.min = other.min
+        self.count += other.count
+        self.total += other.total
+        self.bands += other.bands
+        self.passed += other.passed
+        self.sketch.merge(other.sketch)
+
+    @property
+    def average(self) -> float:
+        return float(self.total / self.count) if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Approximate p-th percentile (0-100); 0 and 100 are exact."""
+        if self.count == 0:
+            return 0.0
+        if p <= 0:
+            return self.min[1]
+        if p >= 100:
+            return self.max[1]
+        return self.sketch.quantile(p / 100)
+
+    def median(self) -> float:
+        return self.percentile(50)
+
+    def distribution(self) -> Dict[str, int]:
+        return {g: int(c) for g, c in zip(self.letters, self.bands)}
+
+def stream_csv(path: str, chunk_size: int = 65536):
+    """Yield (names, scores) chunks using the same row rules as read_csv."""
+    import numpy as np
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        names, scores = [], []
+        for row in reader:
+            if not row:
+                continue
+            try:
+                score = parse_score(row[1])
+            except (IndexError, ValueError):
+                continue
+            names.append(row[0].strip())
+            scores.append(score)
+            if len(scores) >= chunk_size:
+                yield names, np.array(scores)
+                names, scores = [], []
+        if scores:
+            yield names, np.array(scores)
+
+def analyze_csv_streaming(path: str, chunk_size: int = 65536, pass_mark: float = 40.0) -> StreamingStats:
+    """Analyze a mark sheet chunk by chunk in constant memory.
+
+    Unlike read_csv, repeated names are counted once per row.
+    """
+    stats = StreamingStats(pass_mark)
+    try:
+        for names, scores in stream_csv(path, chunk_size):
+            stats.update(names, scores)
+    except FileNotFoundError:
+        print(f"CSV file not found: {path}")
+    except Exception as e:
+        print("Error reading CSV:", e)
+    return stats
+
+def print_streaming_summary(stats: StreamingStats):
+    print(f"\nStudents: {stats.count}")
+    print(f"Average: {stats.average:.2f}")
+    print(f"Median (approx.): {stats.median():.2f}")
+    for p in (25, 75, 90):
+        print(f"{p}th percentile (approx.): {stats.percentile(p):.2f}")
+    print(f"Max: {stats.max[0]} -> {stats.max[1]:.1f}")
+    print(f"Min: {stats.min[0]} -> {stats.min[1]:.1f}")
+    print("\nGrade distribution:")
+    for g, c in stats.distribution().items():
+        print(f"{g}: {c}")
+    print(f"\nPassed: {stats.passed}")
+    print(f"Failed: {stats.count - stats.passed}")
+
+# Batch mode: grade many course sections in parallel
+def grade_section(path: str, out_dir: str, pass_mark: float = 40.0,
+                  section: str = None) -> Tuple[str, float, StreamingStats]:
+    """Grade one mark sheet and export its table as <section>_grades.csv.
+
+    Returns the sheet path, its exact median and a StreamingStats partial
+    aggregate that the caller can merge without touching the rows again.
+    """
+    section = section or Path(path).stem
+    marks = read_csv(path)
+    array = MarksArray.from_dict(marks)
+    stats = analyze_marks(array, pass_mark)
+    if marks:
+        export_csv(str(Path(out_dir) / f"{section}_grades.csv"), marks, stats['grades'])
+    partial = StreamingStats(pass_mark)
+    partial.update(array.names, array.scores)
+    return path, stats['median'], partial
+
+def find_mark_sheets(pattern: str) -> List[str]:
+    if Path(pattern).is_dir():
+        return sorted(str(p) for p in Path(pattern).glob('*.csv'))
+    return sorted(glob.glob(pattern))
+
+def section_names(paths: List[str]) -> List[str]:
+    """Name each sheet by its file stem, or by its path below the common
+    folder when stems repeat (sections/a/marks.csv -> a_marks)."""
+    stems = [Path(p).stem for p in paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    resolved = [Path(p).resolve() for p in paths]
+    root = Path(os.path.commonpath(resolved))
+    names = ['_'.join(p.relative_to(root).with_suffix('').parts) for p in resolved]
+    if len(set(names)) != len(names):
+        raise ValueError("Mark sheets map to duplicate section names: " + ", ".join(paths))
+    return names
+
+def grade_sections(pattern: str, out_dir: str, workers: int = None,
+                   pass_mark: float = 40.0) -> StreamingStats:
+    """Grade every sheet matching pattern in a process pool.
+
+    Section partials are merged into one department-level StreamingStats,
+    and a per-section summary table is written to out_dir.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    paths = find_mark_sheets(pattern)
+    if not paths:
+        print(f"No mark sheets found for {pattern}")
+        return StreamingStats(pass_mark)
+    sections = section_names(paths)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    department = StreamingStats(pass_mark)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(grade_section, paths, repeat(out_dir), repeat(pass_mark), sections)
+        for section, (path, section_median, partial) in zip(sections, results):
+            department.merge(partial)
+            rows.append([section, partial.count, f"{partial.average:.2f}",
+                         f"{section_median:.2f}", partial.min[1], partial.max[1],
+                         partial.passed, partial.count - partial.passed,
+                         *partial.distribution().values()])
+
+    summary_path = Path(out_dir) / 'department_summary.csv'
+    with open(summary_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Section", "Students", "Average", "Median", "Min", "Max",
+                         "Passed", "Failed", *department.letters])
+        writer.writerows(rows)
+        writer.writerow(["DEPARTMENT", department.count, f"{department.average:.2f}",
+                         f"{department.median():.2f}", department.min[1], department.max[1],
+                         department.passed, department.count - department.passed,
+                         *department.distribution().values()])
+    print(f"Graded {len(paths)} sections; summary written to {summary_path}")
+    return department
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="GradeBook Analyzer")
+    parser.add_argument('--batch', metavar='DIR_OR_GLOB',
+                        help="grade every mark sheet in a directory or glob non-interactively")
+    parser.add_argument('--out', default='graded', help="output directory for batch mode")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes for batch mode (default: CPU count)")
+    parser.add_argument('--pass-mark', type=float, default=40.0)
+    return parser.parse_args(argv)
+
 def main():
     print("Welcome to GradeBook Analyzer!")
     while True:
-        print("\nMenu:\n1) Manual entry\n2) Load CSV\n3) Demo sample data\n4) Exit")
-        choice = input("Choose an option (1-4): ").strip()
-        if choice == '4':
+        print("\nMenu:\n1) Manual entry\n2) Load CSV\n3) Demo sample data\n"
+              "4) Analyze large CSV (streaming)\n5) Exit")
+        choice = input("Choose an option (1-5): ").strip()
+        if choice == '5':
             print("Goodbye!")
             break
+        if choice == '4':
+            path = input("Enter CSV file path: ").strip()
+            stats = analyze_csv_streaming(path)
+            if stats.count:
+                print_streaming_summary(stats)
+            else:
+                print("No student data available.")
+            continue
         if choice == '1':
             marks = manual_entry()
         elif choice == '2':
@@ -162,13 +686,14 @@ def main():
             print("No student data available. Returning to menu.")
             continue
 
-        avg = calculate_average(marks)
-        med = calculate_median(marks)
-        mx_name, mx_score = find_max_score(marks)
-        mn_name, mn_score = find_min_score(marks)
-        grades = build_gradebook(marks)
-        dist = grade_distribution(grades)
-        passed, failed = pass_fail_lists(marks)
+        stats = analyze_marks(MarksArray.from_dict(marks))
+        avg = stats['average']
+        med = stats['median']
+        mx_name, mx_score = stats['max']
+        mn_name, mn_score = stats['min']
+        grades = stats['grades']
+        dist = stats['distribution']
+        passed, failed = stats['passed'], stats['failed']
 
         print_table(marks, grades)
         print(f"Average: {avg:.2f}")
@@ -181,6 +706,10 @@ def main():
         print(f"\nPassed ({len(passed)}): {', '.join(passed) if passed else 'None'}")
         print(f"Failed ({len(failed)}): {', '.join(failed) if failed else 'None'}")
 
+        if input("\nDo you want to run rank queries? (y/n): ").strip().lower() == 'y':
+            rank_queries(marks)
+            grades = gradebook_array(MarksArray.from_dict(marks))
+
         # Export option
         exp = input("\nDo you want to export the grade table to CSV? (y/n): ").strip().lower()
         if exp == 'y':
@@ -193,8 +722,14 @@ def main():
             break
 
 if __name__ == '__main__':
+    args = parse_args()
     try:
-        main()
+        if args.batch:
+            department = grade_sections(args.batch, args.out, args.workers, args.pass_mark)
+            if department.count:
+                print_streaming_summary(department)
+        else:
+            main()
     except KeyboardInterrupt:
         print("\nInterrupted. Exiting.")
         sys.exit(0)
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+import gradebook as gb
+
+
+def reference_stats(marks):
+    grades = gb.build_gradebook(marks)
+    passed, failed = gb.pass_fail_lists(marks)
+    return {
+        'average': gb.calculate_average(marks),
+        'median': gb.calculate_median(marks),
+        'max': gb.find_max_score(marks),
+        'min': gb.find_min_score(marks),
+        'grades': grades,
+        'distribution': gb.grade_distribution(grades),
+        'passed': passed,
+        'failed': failed,
+    }
+
+
+def test_analyze_marks_matches_reference(tmp_path):
+    rng = random.Random(7)
+    for n in (1, 2, 5, 100, 1001):
+        marks = {f"s{i}": round(rng.uniform(0, 100), rng.choice([0, 1, 2]))
+                 for i in range(n)}
+        assert gb.analyze_marks(gb.MarksArray.from_dict(marks)) == reference_stats(marks)
+        assert gb.gradebook_array(gb.MarksArray.from_dict(marks)) == gb.build_gradebook(marks)
+    demo = gb.sample_demo()
+    assert gb.analyze_marks(gb.MarksArray.from_dict(demo)) == reference_stats(demo)
+
+    # nan/inf parse as floats but have no grade; they are skipped when read
+    # and rejected if passed in directly.
+    sheet = tmp_path / "marks.csv"
+    sheet.write_text("Name,Marks\nA,nan\nB,inf\nC,-inf\nD,55\n")
+    assert gb.read_csv(str(sheet)) == {'D': 55.0}
+    assert [n for names, _ in gb.stream_csv(str(sheet)) for n in names] == ['D']
+    for bad in (float('nan'), float('inf')):
+        with pytest.raises(ValueError):
+            gb.analyze_marks(gb.MarksArray.from_dict({'A': bad, 'D': 55.0}))
+
+
+def test_exact_sum_across_chunks(monkeypatch):
+    from fractions import Fraction
+    import numpy as np
+
+    rng = random.Random(11)
+    values = [rng.uniform(-100, 100) * rng.choice([1, 1e-300, 1e300]) for _ in range(500)]
+    monkeypatch.setattr(gb, "EXACT_SUM_CHUNK", 7)
+    assert gb.exact_sum(np.array(values)) == sum(map(Fraction, values))
+    assert gb.exact_sum(np.array([])) == 0
+
+
+def test_streaming_matches_exact_stats(tmp_path):
+    rng = random.Random(11)
+    marks = {f"s{i}": round(rng.uniform(0, 100), 1) for i in range(20000)}
+    path = tmp_path / "marks.csv"
+    path.write_text("Name,Marks\n" + "".join(f"{n},{s}\n" for n, s in marks.items()))
+
+    stats = gb.analyze_csv_streaming(str(path), chunk_size=1000)
+    ref = reference_stats(marks)
+    assert stats.count == len(marks)
+    assert stats.average == ref['average']
+    assert (stats.max, stats.min) == (ref['max'], ref['min'])
+    assert stats.distribution() == ref['distribution']
+    assert stats.passed == len(ref['passed'])
+    assert sum(len(level) for level in stats.sketch.levels) < 1000
+
+    scores = sorted(marks.values())
+    for p in (10, 50, 90):
+        estimate = stats.percentile(p)
+        rank = sum(s < estimate for s in scores) / len(scores)
+        assert abs(rank - p / 100) < 0.0165
+
+
+def test_grade_sections_merges_partials(tmp_path):
+    rng = random.Random(3)
+    sheets = tmp_path / "sheets"
+    sheets.mkdir()
+    everyone = {}
+    for s in range(3):
+        marks = {f"sec{s}_{i}": float(rng.randint(0, 100)) for i in range(200)}
+        everyone.update(marks)
+        (sheets / f"sec{s}.csv").write_text(
+            "Name,Marks\n" + "".join(f"{n},{v}\n" for n, v in marks.items()))
+
+    out = tmp_path / "graded"
+    dept = gb.grade_sections(str(sheets), str(out), workers=2)
+    ref = reference_stats(everyone)
+    assert dept.count == 600
+    assert dept.average == ref['average']
+    assert dept.distribution() == ref['distribution']
+    assert dept.max[1] == ref['max'][1] and dept.min[1] == ref['min'][1]
+    assert sorted(p.name for p in out.iterdir()) == [
+        "department_summary.csv", "sec0_grades.csv", "sec1_grades.csv", "sec2_grades.csv"]
+
+
+def test_grade_sections_names_repeated_sheet_names_by_folder(tmp_path):
+    for section, score in (("a", 30.0), ("b", 80.0)):
+        (tmp_path / "sections" / section).mkdir(parents=True)
+        (tmp_path / "sections" / section / "marks.csv").write_text(
+            f"Name,Marks\n{section}1,{score}\n{section}2,{score}\n")
+
+    out = tmp_path / "graded"
+    dept = gb.grade_sections(str(tmp_path / "sections" / "*" / "marks.csv"), str(out), workers=1)
+    assert dept.count == 4
+    assert sorted(p.name for p in out.iterdir()) == [
+        "a_marks_grades.csv", "b_marks_grades.csv", "department_summary.csv"]
+    rows = (out / "department_summary.csv").read_text().splitlines()
+    assert [r.split(",")[:3] for r in rows[1:3]] == [["a_marks", "2", "30.00"], ["b_marks", "2", "80.00"]]
+
+
+def test_rank_index_queries_and_edits(monkeypatch):
+    marks = gb.sample_demo()
+    index = gb.RankIndex(marks)
+    assert index.rank('Bob') == 1 and index.rank('Dave') == 5
+    assert index.percentile('Alice') == 60.0
+    assert index.top(2) == [('Bob', 92), ('Eve', 88)]
+    assert [n for n, _ in index.between(65, 80)] == ['Alice', 'Carol']
+    with pytest.raises(ValueError):
+        index.top(-1)
+
+    answers = iter(['Dave', '95', 'Frank', '88', 'done'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    gb.manual_entry(marks, index)
+    assert marks['Dave'] == 95.0
+    assert index.top(1) == [('Dave', 95.0)]
+    assert index.rank('Frank') == index.rank('Eve') == 3
+    assert index.rank('Carol') == 6
+
+    rebuilt = gb.RankIndex(marks)
+    assert [n for n, _ in index.top(6)] == [n for n, _ in rebuilt.top(6)]
+
+
+def test_rank_queries_rejects_non_positive_top_n(monkeypatch, capsys):
+    answers = iter(['2', '-2', '2', '0', '2', '1', '5'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    gb.rank_queries(gb.sample_demo())
+    out = capsys.readouterr().out
+    assert out.count("Invalid number.") == 2
+    assert "1. Bob" in out and "Eve" not in out
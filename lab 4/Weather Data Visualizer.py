@@ -1,12 +1,26 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+import argparse
+import os
+
+# pandas, NumPy and matplotlib are imported inside the functions that use
+# them, so `--help` or a missing data file does not pay for loading them.
 
-# --- Task 1: Data Acquisition and Loading ---
-print("Task 1: Loading Data...")
 # Replace 'your_weather_data.csv' with your actual file path
-file_path = 'your_weather_data.csv'
-try:
+FILE_PATH = 'your_weather_data.csv'
+# Replace 'Date_Column_Name' with the actual name of your date column
+DATE_COLUMN = 'Date_Column_Name'
+# Replace these placeholders with your actual column names for Temperature, Rainfall, and Humidity
+TEMP_COL = 'Temperature_C'
+RAIN_COL = 'Rainfall_mm'
+HUMIDITY_COL = 'Humidity_perc'
+
+
+# --- Task 1: Data Acquisition and Loading ---
+def load_data(file_path):
+    print("Task 1: Loading Data...")
+    if not os.path.exists(file_path):
+        print(f"Error: File not found at {file_path}")
+        return None
+    import pandas as pd
     df = pd.read_csv(file_path)
     print("Data loaded successfully.")
     print("\nDataFrame Head:")
@@ -15,134 +29,252 @@ try:
     df.info()
     print("\nDataFrame Describe:")
     print(df.describe())
-except FileNotFoundError:
-    print(f"Error: File not found at {file_path}")
-    exit()
+    return df
+
 
 # --- Task 2: Data Cleaning and Processing ---
-print("\n--- Task 2: Cleaning and Processing Data ---")
+def clean_data(df, date_col=DATE_COLUMN):
+    print("\n--- Task 2: Cleaning and Processing Data ---")
+    import pandas as pd
 
-# **Step 2.1: Convert Date Column**
-# Replace 'Date_Column_Name' with the actual name of your date column
-DATE_COLUMN = 'Date_Column_Name'
-df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN], errors='coerce')
-df.set_index(DATE_COLUMN, inplace=True)
+    # **Step 2.1: Convert Date Column**
+    df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+    df.set_index(date_col, inplace=True)
 
-# **Step 2.2: Define Relevant Columns**
-# Replace these placeholders with your actual column names for Temperature, Rainfall, and Humidity
-TEMP_COL = 'Temperature_C'
-RAIN_COL = 'Rainfall_mm'
-HUMIDITY_COL = 'Humidity_perc'
+    # **Step 2.2: Filter for relevant columns**
+    relevant_cols = [TEMP_COL, RAIN_COL, HUMIDITY_COL]
+    df = df[relevant_cols].copy()
 
-# Filter for relevant columns
-relevant_cols = [TEMP_COL, RAIN_COL, HUMIDITY_COL]
-df = df[relevant_cols].copy()
+    # **Step 2.3: Handle Missing Values** [cite: 21]
+    # Decide on your strategy:
+    # Option 1: Drop rows with any missing values
+    # df.dropna(inplace=True)
 
-# **Step 2.3: Handle Missing Values** [cite: 21]
-# Decide on your strategy:
-# Option 1: Drop rows with any missing values
-# df.dropna(inplace=True)
+    # Option 2: Fill missing temperature/humidity with the mean or median (Example using median)
+    # df[TEMP_COL].fillna(df[TEMP_COL].median(), inplace=True)
+    # df[HUMIDITY_COL].fillna(df[HUMIDITY_COL].median(), inplace=True)
 
-# Option 2: Fill missing temperature/humidity with the mean or median (Example using median)
-# df[TEMP_COL].fillna(df[TEMP_COL].median(), inplace=True)
-# df[HUMIDITY_COL].fillna(df[HUMIDITY_COL].median(), inplace=True)
+    # Option 3: Fill missing rainfall (often 0 for no rain)
+    # df[RAIN_COL].fillna(0, inplace=True)
 
-# Option 3: Fill missing rainfall (often 0 for no rain)
-# df[RAIN_COL].fillna(0, inplace=True)
+    # For this example, we'll drop rows with NaNs for simplicity, but choose the best for your data.
+    df.dropna(inplace=True)
+    print(f"Cleaned data shape: {df.shape}")
+    return df
 
-# For this example, we'll drop rows with NaNs for simplicity, but choose the best for your data.
-df.dropna(inplace=True)
-print(f"Cleaned data shape: {df.shape}")
 
 # --- Task 3: Statistical Analysis with NumPy ---
-print("\n--- Task 3: Statistical Analysis ---")
+def analyze_data(df):
+    print("\n--- Task 3: Statistical Analysis ---")
+    import numpy as np
 
-# **Daily Statistics** (Already available in the DataFrame after cleaning)
-print(f"Daily Mean Temperature: {np.mean(df[TEMP_COL]):.2f}")
-print(f"Daily Max Humidity: {np.max(df[HUMIDITY_COL]):.2f}")
+    # **Daily Statistics** (Already available in the DataFrame after cleaning)
+    print(f"Daily Mean Temperature: {np.mean(df[TEMP_COL]):.2f}")
+    print(f"Daily Max Humidity: {np.max(df[HUMIDITY_COL]):.2f}")
 
-# **Monthly Statistics (Example: Mean Temperature)** [cite: 25, 26]
-monthly_mean_temp = df[TEMP_COL].resample('M').mean()
-print("\nMonthly Mean Temperature (first 5 months):")
-print(monthly_mean_temp.head())
+    # **Monthly Statistics (Example: Mean Temperature)** [cite: 25, 26]
+    monthly_mean_temp = df[TEMP_COL].resample('ME').mean()
+    print("\nMonthly Mean Temperature (first 5 months):")
+    print(monthly_mean_temp.head())
 
-# **Yearly Statistics (Example: Total Rainfall)**
-yearly_total_rain = df[RAIN_COL].resample('Y').sum()
-print("\nYearly Total Rainfall:")
-print(yearly_total_rain)
+    # **Yearly Statistics (Example: Total Rainfall)**
+    yearly_total_rain = df[RAIN_COL].resample('YE').sum()
+    print("\nYearly Total Rainfall:")
+    print(yearly_total_rain)
 
-# --- Task 5: Grouping and Aggregation (Monthly Total Rainfall) ---
-print("\n--- Task 5: Grouping and Aggregation ---")
+    # --- Task 5: Grouping and Aggregation (Monthly Total Rainfall) ---
+    print("\n--- Task 5: Grouping and Aggregation ---")
+
+    # Using resampling for monthly aggregation
+    monthly_rainfall_total = df[RAIN_COL].resample('ME').sum()
+    print("\nMonthly Total Rainfall aggregated using resample (first 5 months):")
+    print(monthly_rainfall_total.head())
+    return monthly_rainfall_total
 
-# Using resampling for monthly aggregation 
-monthly_rainfall_total = df[RAIN_COL].resample('M').sum()
-print("\nMonthly Total Rainfall aggregated using resample (first 5 months):")
-print(monthly_rainfall_total.head())
 
 # --- Task 4: Visualization with Matplotlib ---
-print("\n--- Task 4: Creating Visualizations ---")
+# Above this many points, scatter data is hexbinned and line plots are thinned
+# and rasterized, so render time and file size stay bounded on huge datasets.
+DENSE_POINTS = 50_000
+# A thinned line keeps about two points per horizontal pixel of a 14-inch figure.
+LINE_POINTS = 4_000
+
+
+def thin_series(series, max_points=LINE_POINTS):
+    """Keep each bucket's min and max so peaks survive, at most max_points points."""
+    if len(series) <= max_points:
+        return series
+    import numpy as np
+    bucket = -(-len(series) // (max_points // 2))
+    grouped = series.reset_index(drop=True).groupby(np.arange(len(series)) // bucket)
+    keep = np.union1d(grouped.idxmin().values, grouped.idxmax().values)
+    return series.iloc[keep]
+
 
 # **Plot 1: Line Chart for Daily Temperature Trends** [cite: 29]
-plt.figure(figsize=(12, 6))
-plt.plot(df.index, df[TEMP_COL], label='Daily Temperature', color='coral')
-plt.title('Daily Temperature Trend')
-plt.xlabel('Date')
-plt.ylabel('Temperature (°C)')
-plt.legend()
-plt.grid(True)
-# plt.savefig('daily_temp_trend.png') # Task 6: Save plot
-# plt.show()
+def draw_temperature_line(plt, df, dense_points=DENSE_POINTS):
+    fig = plt.figure(figsize=(12, 6))
+    temp = df[TEMP_COL] if len(df) <= dense_points else thin_series(df[TEMP_COL])
+    plt.plot(temp.index, temp, label='Daily Temperature', color='coral',
+             rasterized=len(df) > dense_points)
+    plt.title('Daily Temperature Trend')
+    plt.xlabel('Date')
+    plt.ylabel('Temperature (°C)')
+    plt.legend()
+    plt.grid(True)
+    return fig
+
 
 # **Plot 2: Bar Chart for Monthly Rainfall Totals** [cite: 30]
-plt.figure(figsize=(10, 5))
-monthly_rainfall_total.plot(kind='bar', color='skyblue')
-plt.title('Monthly Rainfall Totals')
-plt.xlabel('Month')
-plt.ylabel('Total Rainfall (mm)')
-plt.xticks(rotation=45)
-plt.tight_layout()
-# plt.savefig('monthly_rainfall_bar.png') # Task 6: Save plot
-# plt.show()
+def draw_rainfall_bar(plt, monthly_rainfall_total):
+    fig = plt.figure(figsize=(10, 5))
+    labels = monthly_rainfall_total.index.strftime('%Y-%m')
+    plt.bar(range(len(labels)), monthly_rainfall_total.values, color='skyblue')
+    # Label at most ~24 bars so long records stay readable and cheap to draw
+    step = max(1, len(labels) // 24)
+    plt.xticks(range(0, len(labels), step), labels[::step], rotation=45)
+    plt.title('Monthly Rainfall Totals')
+    plt.xlabel('Month')
+    plt.ylabel('Total Rainfall (mm)')
+    plt.tight_layout()
+    return fig
+
 
 # **Plot 3: Scatter Plot for Humidity vs. Temperature** [cite: 31]
-plt.figure(figsize=(8, 6))
-plt.scatter(df[HUMIDITY_COL], df[TEMP_COL], alpha=0.6, color='darkgreen')
-plt.title('Humidity vs. Temperature')
-plt.xlabel('Humidity (%)')
-plt.ylabel('Temperature (°C)')
-# plt.savefig('humidity_temp_scatter.png') # Task 6: Save plot
-# plt.show()
+def draw_humidity_scatter(plt, df, dense_points=DENSE_POINTS):
+    fig = plt.figure(figsize=(8, 6))
+    if len(df) > dense_points:
+        plt.hexbin(df[HUMIDITY_COL], df[TEMP_COL], gridsize=80, mincnt=1, cmap='Greens',
+                   rasterized=True)
+        plt.colorbar(label='Days')
+    else:
+        plt.scatter(df[HUMIDITY_COL], df[TEMP_COL], alpha=0.6, color='darkgreen')
+    plt.title('Humidity vs. Temperature')
+    plt.xlabel('Humidity (%)')
+    plt.ylabel('Temperature (°C)')
+    return fig
+
 
 # **Plot 4: Combine at least two plots in a single figure (Subplots)** [cite: 32]
-fig, axes = plt.subplots(nrows=2, ncols=1, figsize=(14, 10))
-fig.suptitle('Combined Weather Trends', fontsize=16)
-
-# Subplot 1: Daily Temperature
-axes[0].plot(df.index, df[TEMP_COL], label='Temperature', color='red')
-axes[0].set_title('Daily Temperature')
-axes[0].set_ylabel('Temperature (°C)')
-axes[0].grid(True)
-
-# Subplot 2: Daily Humidity
-axes[1].plot(df.index, df[HUMIDITY_COL], label='Humidity', color='blue')
-axes[1].set_title('Daily Humidity')
-axes[1].set_xlabel('Date')
-axes[1].set_ylabel('Humidity (%)')
-axes[1].grid(True)
-
-plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # Adjust layout to prevent title overlap
-# plt.savefig('combined_subplots.png') # Task 6: Save plot
-plt.show() # Uncomment to display all plots at the end
+def draw_combined(plt, df, dense_points=DENSE_POINTS):
+    dense = len(df) > dense_points
+    fig, axes = plt.subplots(nrows=2, ncols=1, figsize=(14, 10))
+    fig.suptitle('Combined Weather Trends', fontsize=16)
+
+    # Subplot 1: Daily Temperature
+    temp = thin_series(df[TEMP_COL]) if dense else df[TEMP_COL]
+    axes[0].plot(temp.index, temp, label='Temperature', color='red', rasterized=dense)
+    axes[0].set_title('Daily Temperature')
+    axes[0].set_ylabel('Temperature (°C)')
+    axes[0].grid(True)
+
+    # Subplot 2: Daily Humidity
+    humidity = thin_series(df[HUMIDITY_COL]) if dense else df[HUMIDITY_COL]
+    axes[1].plot(humidity.index, humidity, label='Humidity', color='blue', rasterized=dense)
+    axes[1].set_title('Daily Humidity')
+    axes[1].set_xlabel('Date')
+    axes[1].set_ylabel('Humidity (%)')
+    axes[1].grid(True)
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95]) # Adjust layout to prevent title overlap
+    return fig
+
+
+# Figure name -> (draw function, columns it needs; None means the monthly rainfall series,
+# which is already one bar per month and takes no dense_points)
+FIGURES = {
+    'daily_temp_trend': (draw_temperature_line, [TEMP_COL]),
+    'monthly_rainfall_bar': (draw_rainfall_bar, None),
+    'humidity_temp_scatter': (draw_humidity_scatter, [HUMIDITY_COL, TEMP_COL]),
+    'combined_subplots': (draw_combined, [TEMP_COL, HUMIDITY_COL]),
+}
+
+
+def render_figure(name, data, out_dir, fmt='png', dpi=150, dense_points=DENSE_POINTS):
+    """Draw one figure with the non-interactive Agg backend and save it (Task 6)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    draw, columns = FIGURES[name]
+    fig = draw(plt, data) if columns is None else draw(plt, data, dense_points)
+    path = os.path.join(out_dir, f'{name}.{fmt}')
+    fig.savefig(path, format=fmt, dpi=dpi)
+    plt.close(fig)
+    return path
+
+
+def export_figures(df, monthly_rainfall_total, out_dir='figures', fmt='png', dpi=150,
+                   workers=None, dense_points=DENSE_POINTS):
+    """Render all figures headlessly, each in its own worker process."""
+    print("\n--- Task 4: Creating Visualizations ---")
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for name, (_, columns) in FIGURES.items():
+            # Ship each worker only the columns its figure uses.
+            data = monthly_rainfall_total if columns is None else df[columns]
+            futures.append(pool.submit(render_figure, name, data, out_dir, fmt, dpi, dense_points))
+        paths = [f.result() for f in futures]
+    for path in paths:
+        print(f"Saved {path}")
+    return paths
+
+
+def plot_data(df, monthly_rainfall_total, dense_points=DENSE_POINTS):
+    """Open all figures in interactive windows."""
+    import matplotlib.pyplot as plt
+
+    for name, (draw, columns) in FIGURES.items():
+        if columns is None:
+            draw(plt, monthly_rainfall_total)
+        else:
+            draw(plt, df, dense_points)
+    plt.show()
+
 
 # --- Task 6: Export and Storytelling ---
-print("\n--- Task 6: Exporting Data ---")
+def export_data(df, cleaned_file_path='cleaned_weather_data.csv'):
+    print("\n--- Task 6: Exporting Data ---")
+
+    # **Export cleaned data to a new CSV file** [cite: 37]
+    df.to_csv(cleaned_file_path)
+    print(f"Cleaned data exported to {cleaned_file_path}")
+
+    # **Note on Report:** The report (Task 6, part 2) must be written separately (Markdown or .txt)
+    # and summarize the trends and anomalies you observe in the data and plots[cite: 39].
+
+    # Plots are saved by export_figures() (see --out-dir, --format and --dpi)[cite: 38].
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weather Data Visualizer")
+    parser.add_argument('file', nargs='?', default=FILE_PATH, help="weather CSV file")
+    parser.add_argument('--date-col', default=DATE_COLUMN, help="name of the date column")
+    parser.add_argument('--out-dir', default='figures', help="folder for exported figures")
+    parser.add_argument('--format', default='png', help="figure format, e.g. png, svg, pdf")
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes for rendering (default: CPU count)")
+    parser.add_argument('--dense-points', type=int, default=DENSE_POINTS,
+                        help="above this many rows, hexbin the scatter and rasterize lines")
+    parser.add_argument('--show', action='store_true',
+                        help="also open the figures in interactive windows")
+    args = parser.parse_args()
 
-# **Export cleaned data to a new CSV file** [cite: 37]
-cleaned_file_path = 'cleaned_weather_data.csv'
-df.to_csv(cleaned_file_path)
-print(f"Cleaned data exported to {cleaned_file_path}")
+    df = load_data(args.file)
+    if df is None:
+        return
+    df = clean_data(df, args.date_col)
+    monthly_rainfall_total = analyze_data(df)
+    export_figures(df, monthly_rainfall_total, args.out_dir, args.format, args.dpi,
+                   args.workers, args.dense_points)
+    export_data(df)
+    if args.show:
+        plot_data(df, monthly_rainfall_total, args.dense_points)
 
-# **Note on Report:** The report (Task 6, part 2) must be written separately (Markdown or .txt)
-# and summarize the trends and anomalies you observe in the data and plots[cite: 39].
 
-# Final Note: Remember to save all plots using plt.savefig() and include them in your submission[cite: 38].
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# The script's file name has spaces, so load it by path. Registering it in
+# sys.modules lets the export worker processes find render_figure.
+spec = importlib.util.spec_from_file_location(
+    "weather_data_visualizer", Path(__file__).with_name("Weather Data Visualizer.py"))
+wdv = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = wdv
+spec.loader.exec_module(wdv)
+
+
+def weather_frame(days):
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=days, freq="D")
+    return pd.DataFrame({
+        wdv.TEMP_COL: rng.normal(20, 5, days),
+        wdv.RAIN_COL: rng.exponential(2, days),
+        wdv.HUMIDITY_COL: rng.uniform(20, 90, days),
+    }, index=index)
+
+
+@pytest.mark.parametrize("days", [60, 400])
+def test_export_figures_writes_every_figure(tmp_path, days):
+    df = weather_frame(days)
+    monthly = df[wdv.RAIN_COL].resample("ME").sum()
+    out = tmp_path / "figures"
+    paths = wdv.export_figures(df, monthly, out_dir=str(out), fmt="svg", dpi=50,
+                               workers=2, dense_points=100)
+
+    assert sorted(Path(p).name for p in paths) == sorted(f"{name}.svg" for name in wdv.FIGURES)
+    assert sorted(p.name for p in out.iterdir()) == sorted(Path(p).name for p in paths)
+    # Small data stays vector; only the dense scatter becomes an embedded image.
+    scatter = (out / "humidity_temp_scatter.svg").read_text()
+    assert ("<image" in scatter) == (days > 100)
@@ -1,19 +1,67 @@
-import pandas as pd
-import numpy as np
+import argparse
+import json
 import os
 from pathlib import Path
-import matplotlib.pyplot as plt
+
+# pandas, NumPy and matplotlib are imported inside the functions that use
+# them so `--help` or a run with no data starts without loading them.
 
 # --- CONFIGURATION ---
 DATA_DIR = Path("data")
 OUTPUT_DIR = Path("output")
-OUTPUT_DIR.mkdir(exist_ok=True)  # Create output directory if it doesn't exist
 
 # --- TASK 1: Data Ingestion and Validation ---
-def task_1_ingest_data():
+def parse_partition_name(file_path):
+    """Returns (building, month) from a building_<name>_<month>.csv path.
+    The name may itself contain underscores (building_science_lab_jan.csv)."""
+    parts = Path(file_path).stem.split('_')
+    return '_'.join(parts[1:-1]).capitalize(), parts[-1].capitalize()
+
+
+def read_partition(file_path):
+    """Reads and cleans one building/month CSV file."""
+    import pandas as pd
+    building_name, month_name = parse_partition_name(file_path)
+
+    # 2. Use pandas.read_csv()
+    df = pd.read_csv(
+        file_path,
+        # 3. Handle corrupt data (e.g., skips bad lines)
+        on_bad_lines='skip',
+        header=0
+    )
+
+    # Standardize column names (if possible)
+    # If file has more than 2 columns, try to pick first two relevant columns
+    if len(df.columns) >= 2:
+        df = df.iloc[:, :2]
+        df.columns = ['Timestamp', 'kWh']
+    else:
+        df.columns = ['Timestamp', 'kWh']
+
+    # Convert Timestamp to datetime objects for time-series analysis
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
+
+    # Drop rows where timestamp conversion failed
+    df.dropna(subset=['Timestamp'], inplace=True)
+
+    # Ensure kWh is numeric
+    df['kWh'] = pd.to_numeric(df['kWh'], errors='coerce')
+
+    # Drop rows with invalid kWh
+    df.dropna(subset=['kWh'], inplace=True)
+
+    # Add metadata (e.g., building name, month)
+    df['Building'] = building_name
+    df['Month'] = month_name
+    return df
+
+
+def task_1_ingest_data(csv_files=None):
     """
     Automatically reads multiple CSV files from the /data/ directory,
-    combines them, and cleans the resulting DataFrame.
+    combines them, and cleans the resulting DataFrame. Pass csv_files to
+    load only selected partitions (see select_partitions()).
     """
     print("--- Task 1: Data Ingestion and Validation ---")
 
@@ -21,49 +69,18 @@ def task_1_ingest_data():
     all_data = []
 
     # 1. Loop through /data/ directory and detect .csv files
-    csv_files = list(DATA_DIR.glob("building_A_jan.csv"))
+    if csv_files is None:
+        csv_files = list(DATA_DIR.glob("building_A_jan.csv"))
 
     if not csv_files:
         print(f"ERROR: No CSV files found in {DATA_DIR}. Please add sample data.")
-        return pd.DataFrame()
+        return None
 
-    for file_path in csv_files:
-        building_name = file_path.stem.split('_')[0].capitalize()
-        month_name = file_path.stem.split('_')[-1].capitalize()
+    import pandas as pd
 
+    for file_path in csv_files:
         try:
-            # 2. Use pandas.read_csv()
-            df = pd.read_csv(
-                file_path,
-                # 3. Handle corrupt data (e.g., skips bad lines)
-                on_bad_lines='skip',
-                header=0
-            )
-
-            # Standardize column names (if possible)
-            # If file has more than 2 columns, try to pick first two relevant columns
-            if len(df.columns) >= 2:
-                df = df.iloc[:, :2]
-                df.columns = ['Timestamp', 'kWh']
-            else:
-                df.columns = ['Timestamp', 'kWh']
-
-            # Convert Timestamp to datetime objects for time-series analysis
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-
-            # Drop rows where timestamp conversion failed
-            df.dropna(subset=['Timestamp'], inplace=True)
-
-            # Ensure kWh is numeric
-            df['kWh'] = pd.to_numeric(df['kWh'], errors='coerce')
-
-            # Drop rows with invalid kWh
-            df.dropna(subset=['kWh'], inplace=True)
-
-            # Add metadata (e.g., building name, month)
-            df['Building'] = building_name
-            df['Month'] = month_name
-
+            df = read_partition(file_path)
             all_data.append(df)
             print(f"Successfully loaded: {file_path.name}")
 
@@ -86,9 +103,160 @@ def task_1_ingest_data():
         return pd.DataFrame()
 
 
+# --- TASK 1b: Partition Catalog for Out-of-Core Queries ---
+CATALOG_NAME = "partition_catalog.json"
+
+
+def build_partition_catalog(data_dir=None, catalog_path=None):
+    """
+    Records building, time range, row count and kWh statistics for every
+    building_<name>_<month>.csv file in data_dir, saved as JSON. Files whose
+    size and modification time are unchanged keep their previous entry, so
+    only new or edited partitions are read.
+    """
+    data_dir = Path(data_dir or DATA_DIR)
+    catalog_path = Path(catalog_path or data_dir / CATALOG_NAME)
+
+    previous = {}
+    if catalog_path.exists():
+        previous = {e['file']: e for e in json.loads(catalog_path.read_text())}
+
+    catalog = []
+    for file_path in sorted(data_dir.glob("building_*_*.csv")):
+        stat = file_path.stat()
+        old = previous.get(file_path.name)
+        if old and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime:
+            catalog.append(old)
+            continue
+
+        building_name, month_name = parse_partition_name(file_path)
+        entry = {
+            'file': file_path.name, 'size': stat.st_size, 'mtime': stat.st_mtime,
+            'building': building_name, 'month': month_name, 'rows': 0,
+            'start': None, 'end': None,
+            'kwh_sum': 0.0, 'kwh_min': None, 'kwh_max': None, 'kwh_mean': None,
+        }
+        try:
+            df = read_partition(file_path)
+        except Exception as e:
+            print(f"LOG: Error processing {file_path.name}: {e}")
+            df = None
+        if df is not None and not df.empty:
+            entry.update({
+                'rows': int(len(df)),
+                'start': df['Timestamp'].min().isoformat(),
+                'end': df['Timestamp'].max().isoformat(),
+                'kwh_sum': float(df['kWh'].sum()),
+                'kwh_min': float(df['kWh'].min()),
+                'kwh_max': float(df['kWh'].max()),
+                'kwh_mean': float(df['kWh'].mean()),
+            })
+        catalog.append(entry)
+
+    catalog_path.write_text(json.dumps(catalog, indent=2))
+    print(f"Partition catalog: {len(catalog)} files indexed in {catalog_path}")
+    return catalog
+
+
+def select_partitions(catalog, buildings=None, start=None, end=None):
+    """
+    Returns catalog entries for the given buildings whose time range overlaps
+    [start, end). Other files are skipped without being opened.
+    """
+    import pandas as pd
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+    wanted = {b.capitalize() for b in buildings} if buildings else None
+
+    selected = []
+    for entry in catalog:
+        if entry['rows'] == 0:
+            continue
+        if wanted is not None and entry['building'] not in wanted:
+            continue
+        if start is not None and pd.Timestamp(entry['end']) < start:
+            continue
+        if end is not None and pd.Timestamp(entry['start']) >= end:
+            continue
+        selected.append(entry)
+    return selected
+
+
+def load_partitions(entries, start=None, end=None, data_dir=None):
+    """Loads only the given partitions, trimmed to [start, end)."""
+    data_dir = Path(data_dir or DATA_DIR)
+    df = task_1_ingest_data([data_dir / e['file'] for e in entries])
+    if df is None or df.empty:
+        return df
+    if start is not None:
+        df = df[df.index >= start]
+    if end is not None:
+        df = df[df.index < end]
+    return df
+
+
+def catalog_building_summary(catalog, buildings=None, start=None, end=None, data_dir=None):
+    """
+    Building-wise mean/min/max/total like building_wise_summary(), answered
+    from the catalog statistics for partitions that lie wholly inside
+    [start, end). Only partitions that straddle a boundary are read.
+    """
+    import pandas as pd
+    start_ts = pd.Timestamp(start) if start is not None else None
+    end_ts = pd.Timestamp(end) if end is not None else None
+    data_dir = Path(data_dir or DATA_DIR)
+
+    totals = {}  # building -> [sum, rows, min, max]
+    def add(building, kwh_sum, rows, kwh_min, kwh_max):
+        t = totals.setdefault(building, [0.0, 0, kwh_min, kwh_max])
+        t[0] += kwh_sum
+        t[1] += rows
+        t[2] = min(t[2], kwh_min)
+        t[3] = max(t[3], kwh_max)
+
+    for entry in select_partitions(catalog, buildings, start, end):
+        inside = ((start_ts is None or pd.Timestamp(entry['start']) >= start_ts) and
+                  (end_ts is None or pd.Timestamp(entry['end']) < end_ts))
+        if inside:
+            add(entry['building'], entry['kwh_sum'], entry['rows'],
+                entry['kwh_min'], entry['kwh_max'])
+            continue
+        df = read_partition(data_dir / entry['file'])
+        if start_ts is not None:
+            df = df[df['Timestamp'] >= start_ts]
+        if end_ts is not None:
+            df = df[df['Timestamp'] < end_ts]
+        if not df.empty:
+            add(entry['building'], float(df['kWh'].sum()), len(df),
+                float(df['kWh'].min()), float(df['kWh'].max()))
+
+    summary = pd.DataFrame(
+        [{'Building': b, 'mean': s / n, 'min': lo, 'max': hi, 'total': s}
+         for b, (s, n, lo, hi) in totals.items()],
+        columns=['Building', 'mean', 'min', 'max', 'total'])
+    return summary
+
+
+def task_catalog_summary(buildings=None, start=None, end=None):
+    """
+    Summary-only run: writes building_summary.csv from the partition catalog
+    without loading the readings, so partitions wholly inside [start, end)
+    are never opened.
+    """
+    print("\n--- Building Summary from Partition Catalog ---")
+    summary = catalog_building_summary(build_partition_catalog(), buildings, start, end)
+    print(summary)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    summary_stats_path = OUTPUT_DIR / "building_summary.csv"
+    summary.to_csv(summary_stats_path, index=False)
+    print(f"Exported summary stats to: {summary_stats_path}")
+    return summary
+
+
 # --- TASK 2: Core Aggregation Logic ---
 def calculate_daily_totals(df):
     """Calculates daily total consumption for all buildings."""
+    import pandas as pd
     # Use pd.Grouper on the Timestamp level for robust resampling
     daily_totals = (
         df.groupby(['Building', pd.Grouper(level='Timestamp', freq='D')])['kWh']
@@ -101,6 +269,7 @@ def calculate_daily_totals(df):
 
 def calculate_weekly_aggregates(df):
     """Calculates weekly total consumption for all buildings."""
+    import pandas as pd
     weekly_aggregates = (
         df.groupby(['Building', pd.Grouper(level='Timestamp', freq='W')])['kWh']
         .sum()
@@ -211,6 +380,10 @@ def task_4_visualize_data(daily_data, weekly_data, summary_df, df_combined):
         print("Skipping visualization: Aggregated data is missing.")
         return
 
+    import numpy as np
+    import pandas as pd
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(3, 1, figsize=(12, 18))
 
     # Plot 1: Trend Line (Daily Consumption)
@@ -232,7 +405,7 @@ def task_4_visualize_data(daily_data, weekly_data, summary_df, df_combined):
 
     # Plot 3: Scatter Plot (Peak-Hour Consumption vs. Time)
     df_hourly = (
-        df_combined.groupby(['Building', pd.Grouper(level='Timestamp', freq='H')])['kWh']
+        df_combined.groupby(['Building', pd.Grouper(level='Timestamp', freq='h')])['kWh']
         .max()
         .reset_index()
     )
@@ -248,6 +421,7 @@ def task_4_visualize_data(daily_data, weekly_data, summary_df, df_combined):
     axes[2].grid(True, linestyle='--', alpha=0.6)
 
     plt.tight_layout()
+    OUTPUT_DIR.mkdir(exist_ok=True)
     dashboard_path = OUTPUT_DIR / "dashboard.png"
     plt.savefig(dashboard_path)
     print(f"\nDashboard saved to: {dashboard_path}")
@@ -262,6 +436,8 @@ def task_5_persistence_summary(df_combined, summary_df):
         print("Skipping persistence and summary: Data is missing.")
         return
 
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
     # 1. Export: Final processed dataset
     cleaned_data_path = OUTPUT_DIR / "cleaned_energy_data.csv"
     df_combined.to_csv(cleaned_data_path)
@@ -317,14 +493,43 @@ def task_5_persistence_summary(df_combined, summary_df):
 
 # --- MAIN EXECUTION BLOCK ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Campus energy-use dashboard")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="folder with building CSV files")
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR), help="folder for charts and reports")
+    parser.add_argument("--buildings", nargs="+", help="only load these buildings (uses the partition catalog)")
+    parser.add_argument("--start", help="first date to include, YYYY-MM-DD (uses the partition catalog)")
+    parser.add_argument("--end", help="last date to include, YYYY-MM-DD (uses the partition catalog)")
+    parser.add_argument("--summary-only", action="store_true",
+                        help="only write the building summary, answered from catalog statistics")
+    args = parser.parse_args()
+    DATA_DIR = Path(args.data_dir)
+    OUTPUT_DIR = Path(args.output_dir)
+
     # Ensure data directory exists for Task 1
     DATA_DIR.mkdir(exist_ok=True)
     print(f"Check the '{DATA_DIR}' folder for your CSV data.")
 
+    start = end = None
+    if args.start or args.end:
+        import pandas as pd
+        start = pd.Timestamp(args.start) if args.start else None
+        end = pd.Timestamp(args.end) + pd.Timedelta(days=1) if args.end else None
+
     # Task 1 Execution
-    df_combined = task_1_ingest_data()
+    if args.summary_only:
+        df_combined = None  # answered from the catalog below; no readings are loaded
+    elif args.buildings or args.start or args.end:
+        # Only read the partitions the requested view needs
+        catalog = build_partition_catalog()
+        partitions = select_partitions(catalog, args.buildings, start, end)
+        print(f"Catalog: {len(partitions)} of {len(catalog)} files needed for this view.")
+        df_combined = load_partitions(partitions, start, end) if partitions else None
+    else:
+        df_combined = task_1_ingest_data()
 
-    if df_combined.empty:
+    if args.summary_only:
+        task_catalog_summary(args.buildings, start, end)
+    elif df_combined is None or df_combined.empty:
         print("\n--- Project Aborted: No valid data ingested. ---")
     else:
         # Task 2 Execution
@@ -0,0 +1,88 @@
+import os
+
+import pandas as pd
+import pytest
+
+import energy_dashboard as ed
+
+
+def write_partition(path, first, hours, base=1.0):
+    stamps = pd.date_range(first, periods=hours, freq='h')
+    rows = [f"{t.isoformat(sep=' ')},{base + i % 7}" for i, t in enumerate(stamps)]
+    path.write_text("Timestamp,kWh\n" + "\n".join(rows) + "\n")
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_partition(tmp_path / "building_A_jan.csv", "2024-01-01", 48)
+    write_partition(tmp_path / "building_A_feb.csv", "2024-02-01", 48, base=3.0)
+    write_partition(tmp_path / "building_science_lab_jan.csv", "2024-01-01", 24, base=10.0)
+    return tmp_path
+
+
+def test_partition_name_keeps_underscores():
+    assert ed.parse_partition_name("building_science_lab_jan.csv") == ("Science_lab", "Jan")
+    assert ed.parse_partition_name("data/building_A_feb.csv") == ("A", "Feb")
+
+
+def test_catalog_rebuild_reads_only_changed_files(data_dir, monkeypatch):
+    catalog = ed.build_partition_catalog(data_dir)
+    assert sorted(e['building'] for e in catalog) == ["A", "A", "Science_lab"]
+    assert {e['file']: e['rows'] for e in catalog}["building_A_jan.csv"] == 48
+
+    reads = []
+    original = ed.read_partition
+    monkeypatch.setattr(ed, "read_partition", lambda p: reads.append(p.name) or original(p))
+    assert ed.build_partition_catalog(data_dir) == catalog
+    assert reads == []
+
+    changed = data_dir / "building_A_feb.csv"
+    write_partition(changed, "2024-02-01", 72, base=3.0)
+    os.utime(changed, (1, 1))
+    catalog = ed.build_partition_catalog(data_dir)
+    assert reads == ["building_A_feb.csv"]
+    assert {e['file']: e['rows'] for e in catalog}["building_A_feb.csv"] == 72
+
+
+def test_select_partitions_uses_half_open_window(data_dir):
+    catalog = ed.build_partition_catalog(data_dir)
+    files = lambda entries: sorted(e['file'] for e in entries)
+
+    # end is exclusive: a window ending where February starts skips it
+    assert files(ed.select_partitions(catalog, ["a"], None, "2024-02-01")) == ["building_A_jan.csv"]
+    assert files(ed.select_partitions(catalog, ["a"], "2024-01-02 23:00", None)) == [
+        "building_A_feb.csv", "building_A_jan.csv"]
+    assert files(ed.select_partitions(catalog, ["a"], "2024-01-03", None)) == ["building_A_feb.csv"]
+    assert files(ed.select_partitions(catalog, ["science_lab"])) == ["building_science_lab_jan.csv"]
+
+
+@pytest.mark.parametrize("start,end", [
+    (None, None),                             # every partition from stored stats
+    ("2024-01-01", "2024-03-01"),             # whole partitions inside the window
+    ("2024-01-01 12:00", "2024-02-01 06:00"),  # both A partitions straddle a boundary
+])
+def test_catalog_summary_matches_full_scan(data_dir, start, end):
+    catalog = ed.build_partition_catalog(data_dir)
+    summary = ed.catalog_building_summary(catalog, None, start, end, data_dir)
+
+    df = ed.task_1_ingest_data(sorted(data_dir.glob("building_*.csv")))
+    if start is not None:
+        df = df[(df.index >= start) & (df.index < end)]
+    expected, _ = ed.building_wise_summary(df)
+
+    summary = summary.sort_values('Building').reset_index(drop=True)
+    pd.testing.assert_frame_equal(summary, expected, check_dtype=False)
+
+
+def test_summary_only_run_reads_no_whole_partitions(data_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(ed, "DATA_DIR", data_dir)
+    monkeypatch.setattr(ed, "OUTPUT_DIR", tmp_path / "out")
+    ed.build_partition_catalog()
+
+    reads = []
+    original = ed.read_partition
+    monkeypatch.setattr(ed, "read_partition", lambda p: reads.append(p.name) or original(p))
+    summary = ed.task_catalog_summary(["a"], pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01 06:00"))
+    assert reads == ["building_A_feb.csv"]  # only the partition cut by the window
+    assert summary['Building'].tolist() == ["A"]
+    assert (tmp_path / "out" / "building_summary.csv").exists()
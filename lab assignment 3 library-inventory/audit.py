@@ -0,0 +1,193 @@
+import bisect
+import json
+import logging
+import queue
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from .book import canonical_isbn
+
+
+class AuditLog(logging.Handler):
+    """Structured audit trail for library transactions.
+
+    Book and inventory code log as usual; records that carry an ``audit``
+    extra are queued here and a background thread appends them in batches
+    to rotating JSON-lines segments. Each sealed segment gets a small index
+    file so loan history and time-window queries can seek straight to the
+    matching lines instead of scanning every log.
+    """
+
+    def __init__(self, directory="data/audit", batch_size=100,
+                 flush_interval=1.0, max_segment_bytes=1_000_000):
+        super().__init__()
+        self.directory = Path(directory)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_segment_bytes = max_segment_bytes
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._by_isbn = defaultdict(list)   # isbn -> [(segment, offset)]
+        self._by_time = []                  # sorted [(ts, segment, offset)]
+        self._segment = 0
+        self._segment_isbn = defaultdict(list)
+        self._segment_times = []
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_indexes()
+
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="audit-writer",
+                                        daemon=True)
+        self._worker.start()
+
+    # --- logging.Handler interface ---
+    def emit(self, record):
+        events = getattr(record, "audit", None)
+        if events is None:
+            return
+        # Bulk operations attach a list of events to a single record.
+        if isinstance(events, dict):
+            events = [events]
+        for event in events:
+            self._queue.put_nowait({"ts": record.created, **event})
+
+    def flush(self):
+        """Block until every queued event has been written."""
+        self._queue.join()
+
+    def close(self):
+        if not self._stop.is_set():
+            self.flush()
+            self._stop.set()
+            self._worker.join()
+        super().close()
+
+    # --- queries ---
+    def loan_history(self, isbn):
+        """Issue/return events for one ISBN, oldest first."""
+        with self._lock:
+            locations = list(self._by_isbn.get(canonical_isbn(isbn), []))
+        return [e for e in self._read(locations)
+                if e["action"] in ("issue", "return")]
+
+    def events_between(self, start, end, action=None):
+        """Events with ``start <= ts <= end`` (epoch seconds)."""
+        with self._lock:
+            lo = bisect.bisect_left(self._by_time, (start,))
+            hi = bisect.bisect_right(self._by_time, (end, float("inf")))
+            locations = [(seg, off) for _, seg, off in self._by_time[lo:hi]]
+        events = self._read(locations)
+        if action is not None:
+            events = [e for e in events if e["action"] == action]
+        return events
+
+    def issued_between(self, start, end):
+        return self.events_between(start, end, action="issue")
+
+    # --- storage ---
+    def _segment_path(self, segment):
+        return self.directory / f"audit-{segment:06d}.jsonl"
+
+    def _index_path(self, segment):
+        return self.directory / f"audit-{segment:06d}.idx"
+
+    def _read(self, locations):
+        events = []
+        handles = {}
+        try:
+            for seg, off in locations:
+                if seg not in handles:
+                    handles[seg] = open(self._segment_path(seg), "rb")
+                f = handles[seg]
+                f.seek(off)
+                events.append(json.loads(f.readline()))
+        finally:
+            for f in handles.values():
+                f.close()
+        return events
+
+    def _index_event(self, event, segment, offset):
+        loc = (segment, offset)
+        self._by_isbn[canonical_isbn(event["isbn"])].append(loc)
+        bisect.insort(self._by_time, (event["ts"], segment, offset))
+
+    def _load_indexes(self):
+        segments = sorted(int(p.stem.split("-")[1])
+                          for p in self.directory.glob("audit-*.jsonl"))
+        for seg in segments:
+            idx_path = self._index_path(seg)
+            if idx_path.exists():
+                # Sealed segment: rebuild from its index, not the log itself.
+                index = json.loads(idx_path.read_text())
+                for isbn, offsets in index["isbn"].items():
+                    self._by_isbn[canonical_isbn(isbn)].extend((seg, off) for off in offsets)
+                for ts, off in index["time"]:
+                    bisect.insort(self._by_time, (ts, seg, off))
+                continue
+            # Only the segment that was open when we last stopped lacks one.
+            self._segment = seg
+            with open(self._segment_path(seg), "r+b") as f:
+                offset = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        break
+                    self._track(event, seg, offset)
+                    offset += len(line)
+                # Drop a line torn by a crash so new appends start clean.
+                f.truncate(offset)
+        if segments and self._index_path(self._segment).exists():
+            self._segment = segments[-1] + 1
+
+    def _track(self, event, segment, offset):
+        self._index_event(event, segment, offset)
+        self._segment_isbn[event["isbn"]].append(offset)
+        self._segment_times.append((event["ts"], offset))
+
+    def _seal_segment(self):
+        index = {"isbn": self._segment_isbn, "time": self._segment_times}
+        self._index_path(self._segment).write_text(json.dumps(index))
+        self._segment += 1
+        self._segment_isbn = defaultdict(list)
+        self._segment_times = []
+
+    def _write_batch(self, batch):
+        path = self._segment_path(self._segment)
+        lines = [(json.dumps(event) + "\n").encode("utf-8") for event in batch]
+        with open(path, "ab") as f:
+            start = f.tell()
+            f.write(b"".join(lines))
+        # Index only after the bytes are on disk so queries never see a
+        # half-written line.
+        offset = start
+        with self._lock:
+            for event, line in zip(batch, lines):
+                self._track(event, self._segment, offset)
+                offset += len(line)
+        if offset >= self.max_segment_bytes:
+            self._seal_segment()
+
+    def _run(self):
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Audit write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
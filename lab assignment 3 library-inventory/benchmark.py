@@ -0,0 +1,91 @@
+"""Benchmark the library inventory on synthetic catalogs.
+
+Usage:
+    python -m library_manager.benchmark                # 10k, 1M and 5M books
+    python -m library_manager.benchmark --sizes 10000  # quick run
+
+Each size generates a catalog and a supplier feed in a temporary directory and
+reports wall-clock seconds for load, bulk import, title/ISBN/author search,
+issue/return and save, so regressions in inventory.py show up as numbers.
+"""
+
+import argparse
+import csv
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from library_manager.inventory import LibraryInventory
+
+AUTHORS = [f"Author {i}" for i in range(1000)]
+
+def make_isbn(n):
+    body = f"978{n:09d}"
+    check = (10 - sum((3 if i % 2 else 1) * int(c) for i, c in enumerate(body)) % 10) % 10
+    return body + str(check)
+
+def write_catalog(path, size):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(size):
+            if i:
+                f.write(",")
+            f.write(json.dumps({"title": f"Title {i}", "author": AUTHORS[i % len(AUTHORS)],
+                                "isbn": make_isbn(i), "status": "available"}))
+        f.write("]")
+
+def write_feed(path, start, size):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["title", "author", "isbn"])
+        for i in range(start, start + size):
+            writer.writerow([f"Title {i}", AUTHORS[i % len(AUTHORS)], make_isbn(i)])
+
+def timed(results, name, fn):
+    start = time.perf_counter()
+    out = fn()
+    results[name] = time.perf_counter() - start
+    return out
+
+def run(size, ops=1000, feed_size=10000):
+    results = {}
+    rng = random.Random(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = Path(tmp) / "catalog.json"
+        feed = Path(tmp) / "feed.csv"
+        write_catalog(catalog, size)
+        write_feed(feed, size, feed_size)
+
+        inventory = timed(results, "load", lambda: LibraryInventory(catalog))
+        isbns = [make_isbn(rng.randrange(size)) for _ in range(ops)]
+
+        timed(results, "search_title x10", lambda: [inventory.search_by_title(f"Title {rng.randrange(size)}") for _ in range(10)])
+        timed(results, f"search_isbn x{ops}", lambda: [inventory.search_by_isbn(i) for i in isbns])
+        timed(results, f"filter_author x{ops}", lambda: [inventory.filter_books(author=rng.choice(AUTHORS), status="available") for _ in range(ops)])
+
+        def issue_return():
+            for i in isbns:
+                book = inventory.search_by_isbn(i)
+                book.issue()
+                book.return_book()
+        timed(results, f"issue+return x{ops}", issue_return)
+        timed(results, "save", inventory.save_catalog)
+        timed(results, f"bulk_import {feed_size}", lambda: inventory.bulk_import(feed, batch_size=feed_size))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Library inventory benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 5_000_000])
+    parser.add_argument("--ops", type=int, default=1000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        results = run(size, args.ops)
+        print(f"\n--- {size:,} books ---")
+        for name, seconds in results.items():
+            print(f"{name:24}{seconds:10.4f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,28 @@
 import logging
 
+def canonical_isbn(raw):
+    """ISBN without hyphens/spaces, upper-cased; used as the lookup key everywhere."""
+    return str(raw).replace("-", "").replace(" ", "").upper()
+
 class Book:
     def __init__(self, title, author, isbn, status="available"):
         self.title = title
         self.author = author
         self.isbn = isbn
-        self.status = status
+        self._status = status
+        # Set by LibraryInventory so its status index follows issue/return.
+        self.on_status_change = None
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        old = self._status
+        self._status = value
+        if self.on_status_change is not None and old != value:
+            self.on_status_change(self, old, value)
 
     def __str__(self):
         return f"{self.title} by {self.author} | ISBN: {self.isbn} | Status: {self.status}"
@@ -18,17 +35,23 @@ class Book:
             "status": self.status
         }
 
+    def audit_event(self, action):
+        return {"action": action, "isbn": canonical_isbn(self.isbn), "title": self.title}
+
     def is_available(self):
         return self.status == "available"
 
     def issue(self):
         if self.is_available():
             self.status = "issued"
-            logging.info(f"Book issued: {self.title}")
+            logging.info(f"Book issued: {self.title}",
+                         extra={"audit": self.audit_event("issue")})
             return True
-        logging.error(f"Attempt to issue unavailable book: {self.title}")
+        logging.error(f"Attempt to issue unavailable book: {self.title}",
+                      extra={"audit": self.audit_event("issue_refused")})
         return False
 
     def return_book(self):
         self.status = "available"
-        logging.info(f"Book returned: {self.title}")
+        logging.info(f"Book returned: {self.title}",
+                     extra={"audit": self.audit_event("return")})
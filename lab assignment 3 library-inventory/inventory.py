@@ -1,14 +1,71 @@
+import bisect
+import csv
 import json
 import logging
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
-from .book import Book
+from .book import Book, canonical_isbn
+
+def normalize_isbn(raw):
+    """Return the canonical ISBN, or None if the checksum fails."""
+    isbn = canonical_isbn(raw)
+    if len(isbn) == 10 and isbn[:9].isdigit() and (isbn[9].isdigit() or isbn[9] == "X"):
+        digits = [int(c) for c in isbn[:9]] + [10 if isbn[9] == "X" else int(isbn[9])]
+        if sum((10 - i) * d for i, d in enumerate(digits)) % 11 == 0:
+            return isbn
+    elif len(isbn) == 13 and isbn.isdigit():
+        if sum((3 if i % 2 else 1) * int(c) for i, c in enumerate(isbn)) % 10 == 0:
+            return isbn
+    return None
+
+def read_feed(path):
+    """Yield book records from a CSV or JSON-lines feed, one at a time."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logging.error(f"Skipping malformed feed line: {line[:80]}")
 
 class LibraryInventory:
     def __init__(self, filepath="data/catalog.json"):
         self.filepath = Path(filepath)
         self.books = []
+        self._reset_indexes()
         self.load_catalog()
 
+    def _reset_indexes(self):
+        # Author postings are dicts used as ordered sets of Book objects.
+        # Status changes, so its postings are sorted lists of catalog
+        # positions; both stay in catalog order while books come and go.
+        self._by_isbn = {}
+        self._by_author = defaultdict(dict)
+        self._by_status = defaultdict(list)
+        self._position = {}
+
+    def _index(self, book):
+        position = self._position.setdefault(book, len(self._position))
+        self._by_isbn.setdefault(canonical_isbn(book.isbn), book)
+        self._by_author[book.author.lower()][book] = None
+        self._by_status[book.status].append(position)
+        book.on_status_change = self._status_changed
+
+    def _status_changed(self, book, old, new):
+        position = self._position[book]
+        posting = self._by_status[old]
+        i = bisect.bisect_left(posting, position)
+        if i < len(posting) and posting[i] == position:
+            del posting[i]
+        bisect.insort(self._by_status[new], position)
+
     def load_catalog(self):
         try:
             if not self.filepath.exists():
@@ -19,6 +76,9 @@ class LibraryInventory:
         except Exception as e:
             logging.error(f"Error loading catalog: {e}")
             self.books = []
+        self._reset_indexes()
+        for b in self.books:
+            self._index(b)
 
     def save_catalog(self):
         try:
@@ -28,15 +88,110 @@ class LibraryInventory:
             logging.error(f"Error saving catalog: {e}")
 
     def add_book(self, title, author, isbn):
-        self.books.append(Book(title, author, isbn))
-        logging.info(f"Added new book: {title}")
+        book = Book(title, author, canonical_isbn(isbn))
+        self.books.append(book)
+        self._index(book)
+        logging.info(f"Added new book: {title}",
+                     extra={"audit": book.audit_event("add")})
+        self.save_catalog()
+
+    def bulk_import(self, path, batch_size=10000):
+        """Stream a supplier feed into the catalog, saving once per batch.
+
+        Records that are not objects, rows with a missing title or an invalid
+        ISBN, and ISBNs already in the catalog or earlier in the feed, are
+        skipped. Returns (added, skipped).
+        """
+        seen = set(self._by_isbn)
+        added = skipped = 0
+        batch = []
+        for record in read_feed(path):
+            if not isinstance(record, dict):
+                logging.error(f"Skipping feed record that is not an object: {str(record)[:80]}")
+                skipped += 1
+                continue
+            title = (record.get("title") or "").strip()
+            author = (record.get("author") or "").strip()
+            isbn = normalize_isbn(record.get("isbn") or "")
+            if not title or isbn is None or isbn in seen:
+                skipped += 1
+                continue
+            seen.add(isbn)
+            batch.append(Book(title, author, isbn))
+            if len(batch) >= batch_size:
+                self._commit_batch(batch)
+                added += len(batch)
+                batch = []
+        if batch:
+            self._commit_batch(batch)
+            added += len(batch)
+        logging.info(f"Imported {added} books from {path} ({skipped} skipped)")
+        return added, skipped
+
+    def _commit_batch(self, batch):
+        self.books.extend(batch)
+        for b in batch:
+            self._index(b)
+        # One library.log line per batch; the audit log still gets an "add"
+        # event per book, as add_book() emits.
+        logging.info(f"Bulk added {len(batch)} books",
+                     extra={"audit": [b.audit_event("add") for b in batch]})
         self.save_catalog()
 
+    def export_catalog(self, path):
+        """Write the catalog as CSV or JSON lines, depending on the suffix."""
+        path = Path(path)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if path.suffix.lower() == ".csv":
+                writer = csv.DictWriter(f, fieldnames=["title", "author", "isbn", "status"])
+                writer.writeheader()
+                writer.writerows(b.to_dict() for b in self.books)
+            else:
+                for b in self.books:
+                    f.write(json.dumps(b.to_dict()) + "\n")
+        return len(self.books)
+
     def search_by_title(self, title):
         return [b for b in self.books if title.lower() in b.title.lower()]
 
     def search_by_isbn(self, isbn):
-        return next((b for b in self.books if b.isbn == isbn), None)
+        return self._by_isbn.get(canonical_isbn(isbn))
 
     def display_all(self):
         return self.books
+
+    def available_count(self):
+        return len(self._by_status["available"])
+
+    def issued_count(self):
+        return len(self._by_status["issued"])
+
+    def filter_books(self, author=None, status=None, page=1, per_page=20):
+        """Return one page of books matching every given filter, plus the total.
+
+        Results are in catalog order. A single filter slices its posting and
+        takes the total from its length; with both, the smaller posting is
+        walked once, probing the other filter, to count the matches.
+        """
+        start = (page - 1) * per_page
+        stop = start + per_page
+        by_author = self._by_author.get(author.lower(), {}) if author is not None else None
+        by_status = self._by_status.get(status, []) if status is not None else None
+
+        if by_author is None and by_status is None:
+            return self.books[start:stop], len(self.books)
+        if by_status is None:
+            return list(islice(by_author, start, stop)), len(by_author)
+        if by_author is None:
+            return [self.books[i] for i in by_status[start:stop]], len(by_status)
+
+        if len(by_author) <= len(by_status):
+            matches = (b for b in by_author if b.status == status)
+        else:
+            matches = (b for b in map(self.books.__getitem__, by_status) if b in by_author)
+        books, total = [], 0
+        for b in matches:
+            if start <= total < stop:
+                books.append(b)
+            total += 1
+        return books, total
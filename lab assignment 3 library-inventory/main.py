@@ -1,8 +1,48 @@
+import argparse
 import logging
+import logging.handlers
+import queue
+from datetime import datetime
+from library_manager.audit import AuditLog
 from library_manager.inventory import LibraryInventory
 
-logging.basicConfig(filename="library.log", level=logging.INFO,
-                    format="%(asctime)s - %(levelname)s - %(message)s")
+def setup_logging():
+    # Issue/return/add run on the caller's thread; hand records to a queue so
+    # neither library.log nor the audit store is written inside the transaction.
+    file_handler = logging.FileHandler("library.log")
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    audit = AuditLog()
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.addHandler(audit)
+    return audit, listener
+
+def parse_date(text):
+    return datetime.strptime(text, "%Y-%m-%d").timestamp()
+
+def show_pages(inventory, author=None, status=None, per_page=20):
+    page = 1
+    while True:
+        books, total = inventory.filter_books(author, status, page, per_page)
+        if not books:
+            if page == 1:
+                print("No books found.")
+            return
+        for b in books:
+            print(b)
+        shown = (page - 1) * per_page + len(books)
+        if shown >= total:
+            return
+        more = input(f"Showing {shown} of {total}. Next page? (y/n): ")
+        if more.strip().lower() != "y":
+            return
+        page += 1
 
 def menu():
     print("\n--- Library Inventory Manager ---")
@@ -11,11 +51,42 @@ def menu():
     print("3. Return Book")
     print("4. View All Books")
     print("5. Search Book")
-    print("6. Exit")
+    print("6. Loan History")
+    print("7. Books Issued Between Dates")
+    print("8. Filter Books by Author/Status")
+    print("9. Availability Counts")
+    print("10. Exit")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Library Inventory Manager")
+    sub = parser.add_subparsers(dest="command")
+    imp = sub.add_parser("import", help="bulk import a CSV or JSON-lines feed")
+    imp.add_argument("feed")
+    imp.add_argument("--batch-size", type=int, default=10000)
+    exp = sub.add_parser("export", help="export the catalog as CSV or JSON lines")
+    exp.add_argument("output")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    audit, listener = setup_logging()
+    try:
+        inventory = LibraryInventory()
 
-def main():
-    inventory = LibraryInventory()
+        if args.command == "import":
+            added, skipped = inventory.bulk_import(args.feed, args.batch_size)
+            print(f"Imported {added} books, skipped {skipped}.")
+        elif args.command == "export":
+            count = inventory.export_catalog(args.output)
+            print(f"Exported {count} books to {args.output}.")
+        else:
+            run_menu(inventory, audit)
+    finally:
+        # Drain queued log records and audit events even on Ctrl-C or a crash.
+        listener.stop()
+        audit.close()
 
+def run_menu(inventory, audit):
     while True:
         menu()
         choice = input("Enter choice: ")
@@ -48,8 +119,7 @@ def main():
                     print("Book not found.")
 
             elif choice == "4":
-                for b in inventory.display_all():
-                    print(b)
+                show_pages(inventory)
 
             elif choice == "5":
                 title = input("Enter title search: ")
@@ -60,6 +130,36 @@ def main():
                     print("No books found.")
 
             elif choice == "6":
+                isbn = input("Enter ISBN: ")
+                audit.flush()
+                history = audit.loan_history(isbn)
+                for e in history:
+                    when = datetime.fromtimestamp(e["ts"]).strftime("%Y-%m-%d %H:%M:%S")
+                    print(f"{when} | {e['action']} | {e['title']}")
+                if not history:
+                    print("No loan history found.")
+
+            elif choice == "7":
+                start = parse_date(input("From (YYYY-MM-DD): "))
+                end = parse_date(input("To (YYYY-MM-DD): ")) + 86400
+                audit.flush()
+                issued = audit.issued_between(start, end)
+                for e in issued:
+                    when = datetime.fromtimestamp(e["ts"]).strftime("%Y-%m-%d %H:%M:%S")
+                    print(f"{when} | {e['isbn']} | {e['title']}")
+                if not issued:
+                    print("No books issued in that period.")
+
+            elif choice == "8":
+                author = input("Author (blank for any): ").strip() or None
+                status = input("Status available/issued (blank for any): ").strip() or None
+                show_pages(inventory, author, status)
+
+            elif choice == "9":
+                print(f"Available: {inventory.available_count()}")
+                print(f"Issued: {inventory.issued_count()}")
+
+            elif choice == "10":
                 print("Exiting...")
                 break
 
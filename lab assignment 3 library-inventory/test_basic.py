@@ -3,3 +3,151 @@ from library_manager.book import Book
 def test_book_available():
     b = Book("Test", "Author", "123")
     assert b.is_available()
+
+def test_audit_loan_history(tmp_path):
+    import logging
+    from library_manager.audit import AuditLog
+
+    root = logging.getLogger()
+    level = root.level
+    audit = AuditLog(tmp_path / "audit", flush_interval=0.05, max_segment_bytes=200)
+    root.addHandler(audit)
+    root.setLevel(logging.INFO)
+    try:
+        b = Book("Test", "Author", "123")
+        b.issue()
+        b.return_book()
+        Book("Other", "Author", "456").issue()
+        audit.flush()
+        assert [e["action"] for e in audit.loan_history("123")] == ["issue", "return"]
+        assert [e["isbn"] for e in audit.issued_between(0, float("inf"))] == ["123", "456"]
+    finally:
+        root.removeHandler(audit)
+        root.setLevel(level)
+        audit.close()
+
+    reopened = AuditLog(tmp_path / "audit", flush_interval=0.05)
+    try:
+        assert len(reopened.loan_history("123")) == 2
+    finally:
+        reopened.close()
+
+def test_audit_recovers_from_torn_line(tmp_path):
+    import logging
+    from library_manager.audit import AuditLog
+
+    segment = tmp_path / "audit" / "audit-000000.jsonl"
+    segment.parent.mkdir()
+    segment.write_text('{"ts": 1.0, "action": "issue", "isbn": "123", "title": "T"}\n'
+                       '{"ts": 2.0, "action": "ret')
+    for _ in range(2):
+        audit = AuditLog(tmp_path / "audit", flush_interval=0.05)
+        try:
+            audit.emit(logging.makeLogRecord(
+                {"audit": {"action": "return", "isbn": "123", "title": "T"}}))
+            audit.flush()
+        finally:
+            audit.close()
+    # Both restarts drop only the torn tail and keep indexing new events.
+    reopened = AuditLog(tmp_path / "audit", flush_interval=0.05)
+    try:
+        assert [e["action"] for e in reopened.loan_history("123")] == ["issue", "return", "return"]
+    finally:
+        reopened.close()
+
+def test_filter_and_counters(tmp_path):
+    from library_manager.inventory import LibraryInventory
+
+    inv = LibraryInventory(tmp_path / "catalog.json")
+    inv.add_book("A", "Tolkien", "1")
+    inv.add_book("B", "Tolkien", "2")
+    inv.add_book("C", "Austen", "3")
+    inv.search_by_isbn("2").issue()
+
+    assert inv.available_count() == 2 and inv.issued_count() == 1
+    books, total = inv.filter_books(author="tolkien", status="available")
+    assert total == 1 and books[0].isbn == "1"
+    books, total = inv.filter_books(page=2, per_page=2)
+    assert total == 3 and [b.isbn for b in books] == ["3"]
+
+    inv.search_by_isbn("2").return_book()
+    assert inv.issued_count() == 0
+    # Issue/return must not move a book within the listing while paging.
+    books, total = inv.filter_books(status="available", per_page=2)
+    assert total == 3 and [b.isbn for b in books] == ["1", "2"]
+    books, total = inv.filter_books(author="tolkien", status="available", page=2, per_page=1)
+    assert total == 2 and [b.isbn for b in books] == ["2"]
+    assert LibraryInventory(tmp_path / "catalog.json").available_count() == 3
+
+def test_bulk_import_dedupes_and_validates(tmp_path):
+    from library_manager.inventory import LibraryInventory
+
+    feed = tmp_path / "feed.csv"
+    feed.write_text("title,author,isbn\n"
+                    "Dune,Herbert,978-0-441-17271-9\n"
+                    "Dune again,Herbert,9780441172719\n"
+                    "Bad,Nobody,9780441172710\n"
+                    "Emma,Austen,0-8044-2957-X\n")
+    inv = LibraryInventory(tmp_path / "catalog.json")
+    assert inv.bulk_import(feed, batch_size=1) == (2, 2)
+    assert inv.search_by_isbn("080442957X").title == "Emma"
+
+    out = tmp_path / "export.jsonl"
+    assert inv.export_catalog(out) == 2
+    assert LibraryInventory(tmp_path / "other.json").bulk_import(out) == (2, 0)
+
+    odd = tmp_path / "odd.jsonl"
+    odd.write_text('["x"]\n42\n{"title": "Emma", "author": "Austen", "isbn": "080442957X"}\n')
+    assert LibraryInventory(tmp_path / "third.json").bulk_import(odd) == (1, 2)
+
+def test_isbn_normalized_across_add_search_and_import(tmp_path):
+    import logging
+    from library_manager.audit import AuditLog
+    from library_manager.inventory import LibraryInventory
+
+    root = logging.getLogger()
+    level = root.level
+    audit = AuditLog(tmp_path / "audit", flush_interval=0.05)
+    root.addHandler(audit)
+    root.setLevel(logging.INFO)
+    try:
+        inv = LibraryInventory(tmp_path / "catalog.json")
+        inv.add_book("Dune", "Herbert", "978-0-441-17271-9")
+        feed = tmp_path / "feed.csv"
+        feed.write_text("title,author,isbn\n"
+                        "Dune,Herbert,9780441172719\n"
+                        "Emma,Austen,0-8044-2957-X\n")
+        assert inv.bulk_import(feed) == (1, 1)
+        assert inv.search_by_isbn("978 0 441 17271 9").title == "Dune"
+        assert inv.search_by_isbn("0-8044-2957-x").title == "Emma"
+        audit.flush()
+        assert [e["action"] for e in audit.events_between(0, float("inf"))] == ["add", "add"]
+    finally:
+        root.removeHandler(audit)
+        root.setLevel(level)
+        audit.close()
+
+def test_loan_history_for_hyphenated_catalog_isbn(tmp_path):
+    import json
+    import logging
+    from library_manager.audit import AuditLog
+    from library_manager.inventory import LibraryInventory
+
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text(json.dumps([{"title": "Dune", "author": "Herbert",
+                                    "isbn": "978-0-441-17271-9", "status": "available"}]))
+    root = logging.getLogger()
+    level = root.level
+    audit = AuditLog(tmp_path / "audit", flush_interval=0.05)
+    root.addHandler(audit)
+    root.setLevel(logging.INFO)
+    try:
+        inv = LibraryInventory(catalog)
+        assert inv.search_by_isbn("9780441172719").issue()
+        audit.flush()
+        for spelling in ("9780441172719", "978-0-441-17271-9"):
+            assert [e["action"] for e in audit.loan_history(spelling)] == ["issue"]
+    finally:
+        root.removeHandler(audit)
+        root.setLevel(level)
+        audit.close()
@@ -0,0 +1,52 @@
+"""Startup budget for the command-line tools.
+
+Each CLI is run with `python -X importtime ... --help` in an empty directory.
+Heavy data libraries must not be imported, total import time must stay under
+STARTUP_BUDGET_US, and nothing may be written to the working directory.
+"""
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent
+HEAVY = ("pandas", "numpy", "matplotlib")
+STARTUP_BUDGET_US = 150_000
+
+CLIS = {
+    "gradebook": [str(ROOT / "LAB ASSIGNMENT 2" / "gradebook.py")],
+    "weather": [str(ROOT / "lab 4" / "Weather Data Visualizer.py")],
+    "energy": [str(ROOT / "lab 5 capstone" / "energy_dashboard.py")],
+    "library": ["-m", "library_manager.main"],
+}
+
+
+def import_times(stderr):
+    """Return (every imported module, cumulative microseconds per top-level import)."""
+    modules, times = set(), {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        if not name.startswith("  "):  # nested imports are counted by their parent
+            times[name.strip()] = int(cumulative)
+    return modules, times
+
+
+@pytest.mark.parametrize("name", CLIS)
+def test_cli_help_starts_fast(name, tmp_path):
+    if name == "library" and importlib.util.find_spec("library_manager") is None:
+        pytest.skip("library_manager package is not on the path")
+    result = subprocess.run([sys.executable, "-X", "importtime", *CLIS[name], "--help"],
+                            cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    modules, times = import_times(result.stderr)
+    loaded_heavy = [m for m in modules if m.split(".")[0] in HEAVY]
+    assert not loaded_heavy
+    assert sum(times.values()) < STARTUP_BUDGET_US
+    assert list(tmp_path.iterdir()) == []